@@ -22,6 +22,17 @@ from gui.widgets.board_selector import BoardSelectorWidget
 from gui.dialogs.export_dialog import ExportDialog
 
 
+# Item data role holding a navigation item's full "Section/Child" path
+NAV_PATH_ROLE = Qt.ItemDataRole.UserRole + 100
+
+# Welcome panel stylesheet, applied once to the panel and matched by object name
+_WELCOME_QSS = """
+QLabel#welcomeTitle { font-size: 24px; font-weight: bold; margin-bottom: 20px; }
+QLabel#welcomeSubtitle { font-size: 16px; color: #666; margin-bottom: 40px; }
+QLabel#welcomeInstructions { font-size: 14px; line-height: 1.6; }
+"""
+
+
 class MainWindow(QMainWindow):
     """Main application window for K3NG Configuration Tool"""
 
@@ -36,6 +47,10 @@ class MainWindow(QMainWindow):
         self.project_dir = None
         self.unsaved_changes = False
 
+        # Panels that other handlers reach into; assigned in _create_content_panels
+        self.serial_console = None
+        self.test_runner = None
+
         self._init_ui()
         self._create_menu_bar()
         self._create_status_bar()
@@ -112,16 +127,25 @@ class MainWindow(QMainWindow):
         ]
 
         self.nav_items = {}
+        top_items = []
 
+        # Build items parentless, then insert each level in one call
         for parent_text, children in items:
             parent_item = QTreeWidgetItem([parent_text])
-            tree.addTopLevelItem(parent_item)
+            parent_item.setData(0, NAV_PATH_ROLE, parent_text)
+            top_items.append(parent_item)
             self.nav_items[parent_text] = parent_item
 
+            child_items = []
             for child_text in children:
+                child_path = f"{parent_text}/{child_text}"
                 child_item = QTreeWidgetItem([child_text])
-                parent_item.addChild(child_item)
-                self.nav_items[f"{parent_text}/{child_text}"] = child_item
+                child_item.setData(0, NAV_PATH_ROLE, child_path)
+                child_items.append(child_item)
+                self.nav_items[child_path] = child_item
+            parent_item.addChildren(child_items)
+
+        tree.addTopLevelItems(top_items)
 
         # Expand all by default
         tree.expandAll()
@@ -149,20 +173,26 @@ class MainWindow(QMainWindow):
 
         # Hardware section - Pin configurator
         self.pin_configurator = PinConfiguratorWidget()
-        self.pin_configurator.pin_changed.connect(self._on_pin_changed)
+        self.pin_configurator.pin_changed.connect(
+            lambda name, value: self._on_any_change("Pin", name, value)
+        )
         self.content_stack.addWidget(self.pin_configurator)
         self.panel_indices["Hardware/Pin Configuration"] = self.content_stack.count() - 1
         self.panel_indices["Hardware"] = self.content_stack.count() - 1
 
         # Feature selector
         self.feature_selector = FeatureSelectorWidget()
-        self.feature_selector.feature_changed.connect(self._on_feature_changed)
+        self.feature_selector.feature_changed.connect(
+            lambda name, active: self._on_any_change("Feature", name, "enabled" if active else "disabled")
+        )
         self.content_stack.addWidget(self.feature_selector)
         self.panel_indices["Features"] = self.content_stack.count() - 1
 
         # Settings editor
         self.settings_editor = SettingsEditorWidget()
-        self.settings_editor.setting_changed.connect(self._on_setting_changed)
+        self.settings_editor.setting_changed.connect(
+            lambda name, value: self._on_any_change("Setting", name, value)
+        )
         self.content_stack.addWidget(self.settings_editor)
         self.panel_indices["Settings"] = self.content_stack.count() - 1
 
@@ -192,17 +222,18 @@ class MainWindow(QMainWindow):
     def _create_welcome_panel(self):
         """Create the welcome/start panel"""
         widget = QWidget()
+        widget.setStyleSheet(_WELCOME_QSS)
         layout = QVBoxLayout(widget)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Welcome message
         title = QLabel("K3NG Rotator Configuration Tool")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; margin-bottom: 20px;")
+        title.setObjectName("welcomeTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         subtitle = QLabel("Phase 7 - Testing Framework")
-        subtitle.setStyleSheet("font-size: 16px; color: #666; margin-bottom: 40px;")
+        subtitle.setObjectName("welcomeSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
 
@@ -215,7 +246,7 @@ class MainWindow(QMainWindow):
             "4. Validate your configuration before generating files\n"
             "5. File → Generate Files to create new configuration headers"
         )
-        instructions.setStyleSheet("font-size: 14px; line-height: 1.6;")
+        instructions.setObjectName("welcomeInstructions")
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(instructions)
 
@@ -315,11 +346,10 @@ class MainWindow(QMainWindow):
         if current is None:
             return
 
-        item_text = current.text(0)
-        parent = current.parent()
-
-        # Build full path
-        full_path = f"{parent.text(0)}/{item_text}" if parent else item_text
+        # Full path was tagged on the item when the tree was built
+        full_path = current.data(0, NAV_PATH_ROLE)
+        section, _, child_text = full_path.partition("/")
+        item_text = child_text or section
 
         # Try full path first (for child items with dedicated panels)
         if full_path in self.panel_indices:
@@ -328,13 +358,12 @@ class MainWindow(QMainWindow):
             return
 
         # Fall back to parent section (for parent items or child items without dedicated panels)
-        section = parent.text(0) if parent else item_text
         if section in self.panel_indices:
             self.content_stack.setCurrentIndex(self.panel_indices[section])
             self.status_bar.showMessage(f"Viewing: {section}")
 
             # If clicking on a Features subcategory, focus that category in the feature selector
-            if parent and parent.text(0) == "Features" and hasattr(self, 'feature_selector'):
+            if child_text and section == "Features":
                 # Map navigation items to actual feature categories
                 category_map = {
                     "Protocol Emulation": "Protocol Emulation",
@@ -351,7 +380,7 @@ class MainWindow(QMainWindow):
                     self.status_bar.showMessage(f"Viewing: {item_text} features")
 
             # If clicking on a Settings subcategory, focus that category in the settings editor
-            elif parent and parent.text(0) == "Settings" and hasattr(self, 'settings_editor'):
+            elif child_text and section == "Settings":
                 # Map navigation items to actual settings categories
                 settings_map = {
                     "Motor Control": "Speed & Rotation",
@@ -367,37 +396,8 @@ class MainWindow(QMainWindow):
         else:
             self.status_bar.showMessage(f"Selected: {full_path}")
 
-    def _on_feature_changed(self, feature_name: str, is_active: bool):
-        """Handle feature checkbox change"""
-        # Mark configuration as having unsaved changes
-        self.unsaved_changes = True
-
-        # Update window title to indicate unsaved changes
-        if "*" not in self.windowTitle():
-            self.setWindowTitle(self.windowTitle() + " *")
-
-        # Clear validation status since config changed
-        self.validation_label.setText("Validation: Not run")
-
-        status = "enabled" if is_active else "disabled"
-        self.status_bar.showMessage(f"Feature {feature_name} {status}", 3000)
-
-    def _on_pin_changed(self, pin_name: str, new_value: str):
-        """Handle pin value change"""
-        # Mark configuration as having unsaved changes
-        self.unsaved_changes = True
-
-        # Update window title to indicate unsaved changes
-        if "*" not in self.windowTitle():
-            self.setWindowTitle(self.windowTitle() + " *")
-
-        # Clear validation status since config changed
-        self.validation_label.setText("Validation: Not run")
-
-        self.status_bar.showMessage(f"Pin {pin_name} set to {new_value}", 3000)
-
-    def _on_setting_changed(self, setting_name: str, new_value):
-        """Handle setting value change"""
+    def _on_any_change(self, kind: str, name: str, value):
+        """Handle a feature, pin or setting change from any editor panel"""
         # Mark configuration as having unsaved changes
         self.unsaved_changes = True
 
@@ -408,7 +408,7 @@ class MainWindow(QMainWindow):
         # Clear validation status since config changed
         self.validation_label.setText("Validation: Not run")
 
-        self.status_bar.showMessage(f"Setting {setting_name} = {new_value}", 3000)
+        self.status_bar.showMessage(f"{kind} {name} = {value}", 3000)
 
     def _on_board_selected(self, board_id: str):
         """Handle board selection"""
@@ -430,7 +430,7 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(f"Connected to {port}", 5000)
 
         # Update test runner with command interface
-        if hasattr(self, 'test_runner'):
+        if self.test_runner is not None:
             command_interface = self.serial_console.get_command_interface()
             self.test_runner.set_command_interface(command_interface)
 
@@ -683,7 +683,7 @@ class MainWindow(QMainWindow):
                 return
 
         # Cleanup serial console
-        if hasattr(self, 'serial_console'):
+        if self.serial_console is not None:
             self.serial_console.cleanup()
 
         event.accept()
@@ -6,16 +6,20 @@ Select Arduino board for pin validation
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QListWidget, QListWidgetItem,
-    QTextEdit, QGroupBox, QMessageBox
+    QTextEdit, QGroupBox, QMessageBox, QStyle
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from boards.board_database import BoardDatabase, BoardDefinition
 
 
+# Item data role holding the BoardDefinition itself (UserRole holds the board_id)
+BOARD_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
 class BoardSelectorWidget(QWidget):
     """
     Board selector widget
@@ -27,11 +31,55 @@ class BoardSelectorWidget(QWidget):
     # Signals
     board_selected = pyqtSignal(str)  # board_id
 
+    # Stylesheets, defined once so repeated selections don't rebuild them
+    _SELECT_BUTTON_STYLE = """
+        QPushButton:enabled {
+            background-color: #28a745;
+            color: white;
+            padding: 10px;
+            font-weight: bold;
+            border-radius: 4px;
+        }
+        QPushButton:enabled:hover {
+            background-color: #218838;
+        }
+        QPushButton:disabled {
+            background-color: #cccccc;
+            color: #666666;
+            padding: 10px;
+            border-radius: 4px;
+        }
+    """
+
+    _LABEL_STYLE_IDLE = """
+        QLabel {
+            padding: 10px;
+            background-color: #f0f0f0;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+    """
+
+    _LABEL_STYLE_SELECTED = """
+        QLabel {
+            padding: 10px;
+            background-color: #d4edda;
+            border: 1px solid #c3e6cb;
+            border-radius: 4px;
+            font-weight: bold;
+            color: #155724;
+        }
+    """
+
     def __init__(self, parent=None):
         """Initialize board selector"""
         super().__init__(parent)
         self.board_db = BoardDatabase()
         self.selected_board: Optional[BoardDefinition] = None
+        self._current_style: Optional[str] = None  # "idle" or "selected"
+        self._details_cache: Dict[str, str] = {}  # board_id -> details HTML
+        self._id_to_row: Dict[str, int] = {}  # board_id -> board_list row
+        self._star_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
         self._init_ui()
         self._load_boards()
 
@@ -72,24 +120,7 @@ class BoardSelectorWidget(QWidget):
         self.select_btn = QPushButton("Select This Board")
         self.select_btn.setEnabled(False)
         self.select_btn.clicked.connect(self._on_select_clicked)
-        self.select_btn.setStyleSheet("""
-            QPushButton:enabled {
-                background-color: #28a745;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:enabled:hover {
-                background-color: #218838;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-                padding: 10px;
-                border-radius: 4px;
-            }
-        """)
+        self.select_btn.setStyleSheet(self._SELECT_BUTTON_STYLE)
         list_layout.addWidget(self.select_btn)
 
         content_layout.addWidget(list_group, 1)
@@ -109,16 +140,21 @@ class BoardSelectorWidget(QWidget):
 
         # Current selection indicator
         self.current_label = QLabel("Current Board: None selected")
-        self.current_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #f0f0f0;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-        """)
+        self._set_label_style("idle")
         layout.addWidget(self.current_label)
 
+    def _set_label_style(self, style: str):
+        """Apply the idle/selected stylesheet to the current-board label"""
+        # Skip the re-polish when the label already has this style
+        if self._current_style == style:
+            return
+
+        self._current_style = style
+        if style == "selected":
+            self.current_label.setStyleSheet(self._LABEL_STYLE_SELECTED)
+        else:
+            self.current_label.setStyleSheet(self._LABEL_STYLE_IDLE)
+
     def _load_boards(self):
         """Load available boards into list"""
         boards = self.board_db.get_all_boards()
@@ -126,11 +162,14 @@ class BoardSelectorWidget(QWidget):
         for board in boards:
             item = QListWidgetItem(board.board_name)
             item.setData(Qt.ItemDataRole.UserRole, board.board_id)
+            item.setData(BOARD_ROLE, board)
 
             # Add icon/indicator for recommended boards
             if 'mega' in board.board_id.lower():
-                item.setText(f"⭐ {board.board_name} (Recommended)")
+                item.setIcon(self._star_icon)
+                item.setToolTip("Recommended")
 
+            self._id_to_row[board.board_id] = self.board_list.count()
             self.board_list.addItem(item)
 
     def _on_board_list_selection(self, current: QListWidgetItem, previous: QListWidgetItem):
@@ -140,19 +179,20 @@ class BoardSelectorWidget(QWidget):
             self.details_text.clear()
             return
 
-        # Get board ID from item
+        # Get board from item
         board_id = current.data(Qt.ItemDataRole.UserRole)
-
-        # Load board details
-        board = self.board_db.get_board(board_id)
+        board = current.data(BOARD_ROLE)
         if not board:
             return
 
         # Enable select button
         self.select_btn.setEnabled(True)
 
-        # Display board details
-        details = self._format_board_details(board)
+        # Display board details (definitions don't change within a session)
+        details = self._details_cache.get(board_id)
+        if details is None:
+            details = self._format_board_details(board)
+            self._details_cache[board_id] = details
         self.details_text.setHtml(details)
 
     def _format_board_details(self, board: BoardDefinition) -> str:
@@ -167,57 +207,79 @@ class BoardSelectorWidget(QWidget):
         i2c = board.pins.get('i2c', {})
         serial_ports = board.pins.get('serial', [])
 
-        html = f"""
-        <h2>{board.board_name}</h2>
-        <p><strong>Board ID:</strong> {board.board_id}</p>
-        <p><strong>MCU:</strong> {board.mcu}</p>
-        <p><strong>Description:</strong> {board.description}</p>
-
-        <h3>Pin Capabilities</h3>
-        <table style='width: 100%; border-collapse: collapse;'>
-            <tr style='background-color: #f0f0f0;'>
-                <th style='padding: 5px; text-align: left;'>Type</th>
-                <th style='padding: 5px; text-align: left;'>Count</th>
-                <th style='padding: 5px; text-align: left;'>Details</th>
-            </tr>
-            <tr>
-                <td style='padding: 5px;'><strong>Digital Pins</strong></td>
-                <td style='padding: 5px;'>{digital_count}</td>
-                <td style='padding: 5px;'>Pins {digital_range[0]}-{digital_range[1]}</td>
-            </tr>
-            <tr style='background-color: #f9f9f9;'>
-                <td style='padding: 5px;'><strong>Analog Pins</strong></td>
-                <td style='padding: 5px;'>{analog_count}</td>
-                <td style='padding: 5px;'>{analog_names[0]} to {analog_names[-1]}</td>
-            </tr>
-            <tr>
-                <td style='padding: 5px;'><strong>PWM Pins</strong></td>
-                <td style='padding: 5px;'>{len(pwm_pins)}</td>
-                <td style='padding: 5px;'>{', '.join(map(str, pwm_pins[:10]))}{', ...' if len(pwm_pins) > 10 else ''}</td>
-            </tr>
-            <tr style='background-color: #f9f9f9;'>
-                <td style='padding: 5px;'><strong>Interrupt Pins</strong></td>
-                <td style='padding: 5px;'>{len(interrupt_pins)}</td>
-                <td style='padding: 5px;'>{', '.join(f'Pin {pin} (INT{num})' for pin, num in list(interrupt_pins.items())[:5])}</td>
-            </tr>
-        </table>
-
-        <h3>Communication</h3>
-        <p><strong>I2C:</strong> SDA=Pin {i2c.get('sda', 'N/A')}, SCL=Pin {i2c.get('scl', 'N/A')}</p>
-        <p><strong>Serial Ports:</strong> {len(serial_ports)} available</p>
-
-        <h3>Why Select This Board?</h3>
-        <p>Selecting the correct board enables:</p>
-        <ul>
-            <li>✅ Automatic PWM pin validation for speed control</li>
-            <li>✅ Interrupt pin checking for pulse inputs</li>
-            <li>✅ Analog pin verification for potentiometers</li>
-            <li>✅ Pin conflict detection</li>
-            <li>✅ Board-specific warnings and suggestions</li>
-        </ul>
-        """
-
-        return html
+        # Precompute the list previews once instead of inside the markup
+        pwm_preview = ', '.join(map(str, pwm_pins[:10]))
+        if len(pwm_pins) > 10:
+            pwm_preview += ', ...'
+        interrupt_preview = ', '.join(
+            f'Pin {pin} (INT{num})' for pin, num in list(interrupt_pins.items())[:5]
+        )
+
+        parts = []
+        parts.append(f"<h2>{board.board_name}</h2>")
+        parts.append(f"<p><strong>Board ID:</strong> {board.board_id}</p>")
+        parts.append(f"<p><strong>MCU:</strong> {board.mcu}</p>")
+        parts.append(f"<p><strong>Description:</strong> {board.description}</p>")
+
+        parts.append("<h3>Pin Capabilities</h3>")
+        parts.append("<table style='width: 100%; border-collapse: collapse;'>")
+        parts.append(
+            "<tr style='background-color: #f0f0f0;'>"
+            "<th style='padding: 5px; text-align: left;'>Type</th>"
+            "<th style='padding: 5px; text-align: left;'>Count</th>"
+            "<th style='padding: 5px; text-align: left;'>Details</th>"
+            "</tr>"
+        )
+        parts.append(
+            "<tr>"
+            "<td style='padding: 5px;'><strong>Digital Pins</strong></td>"
+            f"<td style='padding: 5px;'>{digital_count}</td>"
+            f"<td style='padding: 5px;'>Pins {digital_range[0]}-{digital_range[1]}</td>"
+            "</tr>"
+        )
+        parts.append(
+            "<tr style='background-color: #f9f9f9;'>"
+            "<td style='padding: 5px;'><strong>Analog Pins</strong></td>"
+            f"<td style='padding: 5px;'>{analog_count}</td>"
+            f"<td style='padding: 5px;'>{analog_names[0]} to {analog_names[-1]}</td>"
+            "</tr>"
+        )
+        parts.append(
+            "<tr>"
+            "<td style='padding: 5px;'><strong>PWM Pins</strong></td>"
+            f"<td style='padding: 5px;'>{len(pwm_pins)}</td>"
+            f"<td style='padding: 5px;'>{pwm_preview}</td>"
+            "</tr>"
+        )
+        parts.append(
+            "<tr style='background-color: #f9f9f9;'>"
+            "<td style='padding: 5px;'><strong>Interrupt Pins</strong></td>"
+            f"<td style='padding: 5px;'>{len(interrupt_pins)}</td>"
+            f"<td style='padding: 5px;'>{interrupt_preview}</td>"
+            "</tr>"
+        )
+        parts.append("</table>")
+
+        parts.append("<h3>Communication</h3>")
+        parts.append(
+            f"<p><strong>I2C:</strong> SDA=Pin {i2c.get('sda', 'N/A')}, "
+            f"SCL=Pin {i2c.get('scl', 'N/A')}</p>"
+        )
+        parts.append(f"<p><strong>Serial Ports:</strong> {len(serial_ports)} available</p>")
+
+        parts.append("<h3>Why Select This Board?</h3>")
+        parts.append("<p>Selecting the correct board enables:</p>")
+        parts.append(
+            "<ul>"
+            "<li>✅ Automatic PWM pin validation for speed control</li>"
+            "<li>✅ Interrupt pin checking for pulse inputs</li>"
+            "<li>✅ Analog pin verification for potentiometers</li>"
+            "<li>✅ Pin conflict detection</li>"
+            "<li>✅ Board-specific warnings and suggestions</li>"
+            "</ul>"
+        )
+
+        return ''.join(parts)
 
     def _on_select_clicked(self):
         """Handle select button click"""
@@ -226,7 +288,7 @@ class BoardSelectorWidget(QWidget):
             return
 
         board_id = current_item.data(Qt.ItemDataRole.UserRole)
-        board = self.board_db.get_board(board_id)
+        board = current_item.data(BOARD_ROLE)
 
         if not board:
             QMessageBox.warning(
@@ -239,16 +301,7 @@ class BoardSelectorWidget(QWidget):
         # Update current selection
         self.selected_board = board
         self.current_label.setText(f"Current Board: {board.board_name}")
-        self.current_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #d4edda;
-                border: 1px solid #c3e6cb;
-                border-radius: 4px;
-                font-weight: bold;
-                color: #155724;
-            }
-        """)
+        self._set_label_style("selected")
 
         # Emit signal
         self.board_selected.emit(board_id)
@@ -268,26 +321,15 @@ class BoardSelectorWidget(QWidget):
         if not board:
             return
 
-        # Find and select item in list
-        for i in range(self.board_list.count()):
-            item = self.board_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == board_id:
-                self.board_list.setCurrentItem(item)
-                break
+        # Select item in list
+        row = self._id_to_row.get(board_id)
+        if row is not None:
+            self.board_list.setCurrentRow(row)
 
         # Update selection
         self.selected_board = board
         self.current_label.setText(f"Current Board: {board.board_name}")
-        self.current_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #d4edda;
-                border: 1px solid #c3e6cb;
-                border-radius: 4px;
-                font-weight: bold;
-                color: #155724;
-            }
-        """)
+        self._set_label_style("selected")
 
     def get_selected_board(self) -> Optional[BoardDefinition]:
         """Get currently selected board"""
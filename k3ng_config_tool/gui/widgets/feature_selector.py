@@ -3,46 +3,407 @@ K3NG Configuration Tool - Feature Selector Widget
 Displays features in a tree view with checkboxes for enabling/disabling
 """
 
+import sqlite3
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-    QLineEdit, QPushButton, QLabel, QCheckBox
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+    QLineEdit, QPushButton, QLabel
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractItemModel, QModelIndex, QSortFilterProxyModel, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QIcon
+from PyQt6.QtGui import QBrush, QColor
 
 from parsers.feature_parser import FeatureConfig
 
 
-class FeatureItem(QTreeWidgetItem):
-    """Custom tree widget item for a feature"""
+class FeatureTreeModel(QAbstractItemModel):
+    """
+    Two-level item model of feature categories and their features
+
+    Rows read straight from the FeatureConfig, so no per-feature item
+    objects are created. Category indexes carry an internalId of 0;
+    feature indexes carry their category row + 1.
+
+    Each feature gets an integer handle into parallel arrays of names,
+    definitions and lowercased search bytes; category rows store handles.
+
+    Feature rows are fetched lazily: a category reports no rows until the
+    view expands it (canFetchMore/fetchMore) or fetch_all() is called.
+    """
+
+    # Signals
+    feature_toggled = pyqtSignal(str, bool)  # feature_name, is_active
+
+    # Shared red background for conflicting features
+    _CONFLICT_BRUSH = QBrush(QColor(255, 200, 200))
+
+    # Check state indexed by is_active, and the values setData accepts as
+    # checked (views pass the raw int, Python callers may pass the enum)
+    _CHECK_STATES = (Qt.CheckState.Unchecked, Qt.CheckState.Checked)
+    _CHECKED_VALUES = (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
 
-    def __init__(self, feature_name: str, feature_def, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.feature_name = feature_name
-        self.feature_def = feature_def
 
-        # Set feature text
-        self.setText(0, feature_name)
+        self.feature_config = None
+        self._categories = []  # FeatureCategory per top-level row
+
+        # Per-feature arrays, indexed by handle
+        self._handles = {}  # feature_name -> handle
+        self._names = []
+        self._defs = []
+        self._name_lc = []  # lowercased UTF-8 name bytes
+        self._comment_lc = []  # lowercased UTF-8 comment bytes
+        self._positions = []  # fetched (category row, row) pairs showing the feature
+
+        self._resolved = []  # feature handles per category row
+        self._rows = []  # fetched feature handles per category row
+        self._loaded = set()  # names of categories whose rows are fetched
+        self._conflicts = set()  # feature names highlighted as conflicting
+        self._search_db = None  # in-memory FTS5 index over name/comment
+
+    def load(self, feature_config: FeatureConfig):
+        """Reset the model to show the given configuration"""
+        self.beginResetModel()
+
+        self.feature_config = feature_config
+        self._categories = list(feature_config.categories)
+
+        features = feature_config.features
+        self._names = list(features)
+        self._defs = list(features.values())
+        self._handles = {name: handle for handle, name in enumerate(self._names)}
+        self._name_lc = [name.lower().encode() for name in self._names]
+        self._comment_lc = [
+            (feature_def.comment or '').lower().encode() for feature_def in self._defs
+        ]
+        self._positions = [[] for _ in self._names]
+
+        # Resolve each category's feature names to handles once per load
+        handles = self._handles
+        self._resolved = []
+        for category in self._categories:
+            resolved = []
+            for feature_name in category.features:
+                handle = handles.get(feature_name)
+                if handle is not None:
+                    resolved.append(handle)
+            self._resolved.append(resolved)
+
+        self._rows = [[] for _ in self._categories]
+        self._loaded.clear()
+        self._conflicts.clear()
+        self._build_search_index()
+
+        self.endResetModel()
+
+    # Index navigation
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        if parent.internalId() == 0:
+            return self.createIndex(row, column, parent.row() + 1)
+
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._categories)
 
-        # Set tooltip with comment/description
-        if feature_def.comment:
-            self.setToolTip(0, feature_def.comment)
+        if parent.column() == 0 and parent.internalId() == 0:
+            return len(self._rows[parent.row()])
 
-        # Make it checkable
-        self.setFlags(self.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+        return 0
 
-        # Set initial check state
-        if feature_def.is_active:
-            self.setCheckState(0, Qt.CheckState.Checked)
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._categories)
+
+        # Categories always have features; report them before they are fetched
+        return parent.column() == 0 and parent.internalId() == 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+
+        return self._categories[parent.row()].name not in self._loaded
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+
+        cat_row = parent.row()
+        category = self._categories[cat_row]
+        resolved = self._resolved[cat_row]
+
+        if resolved:
+            self.beginInsertRows(parent, 0, len(resolved) - 1)
+            self._rows[cat_row] = resolved
+            for row, handle in enumerate(resolved):
+                self._positions[handle].append((cat_row, row))
+            self._loaded.add(category.name)
+            self.endInsertRows()
         else:
-            self.setCheckState(0, Qt.CheckState.Unchecked)
+            self._loaded.add(category.name)
+
+    def fetch_all(self):
+        """Fetch the rows of every category (needed before filtering)"""
+        for row in range(len(self._categories)):
+            self.fetchMore(self.createIndex(row, 0, 0))
+
+    # Data access
+
+    def feature_name(self, index: QModelIndex):
+        """Get the feature name for an index, or None for category rows"""
+        if not index.isValid() or index.internalId() == 0:
+            return None
+
+        return self._names[self._rows[index.internalId() - 1][index.row()]]
+
+    def feature_def(self, index: QModelIndex):
+        """Get the feature definition for an index, or None for category rows"""
+        if not index.isValid() or index.internalId() == 0:
+            return None
+
+        return self._defs[self._rows[index.internalId() - 1][index.row()]]
+
+    def _build_search_index(self):
+        """Index feature names and comments in an in-memory FTS5 trigram table"""
+        if self._search_db is not None:
+            self._search_db.close()
+            self._search_db = None
+
+        try:
+            db = sqlite3.connect(":memory:")
+            db.execute(
+                "CREATE VIRTUAL TABLE feature_search "
+                "USING fts5(name, comment, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5/trigram; match_features() scans instead
+            return
+
+        db.executemany(
+            "INSERT INTO feature_search VALUES (?, ?)",
+            (
+                (name, feature_def.comment or '')
+                for name, feature_def in zip(self._names, self._defs)
+            )
+        )
+        self._search_db = db
+
+    def match_features(self, search_text: str) -> set:
+        """Get names of features whose name or comment contains search_text"""
+        if self._search_db is not None and len(search_text) >= 3:
+            # A quoted phrase MATCH is served by the trigram index as a
+            # case-insensitive substring search over both columns
+            phrase = '"' + search_text.replace('"', '""') + '"'
+            rows = self._search_db.execute(
+                "SELECT name FROM feature_search WHERE feature_search MATCH ?",
+                (phrase,)
+            )
+            return {name for (name,) in rows}
+
+        # Text shorter than one trigram cannot use the index; scan instead
+        needle = search_text.lower().encode()
+        comment_lc = self._comment_lc
+        return {
+            self._names[handle]
+            for handle, name_lc in enumerate(self._name_lc)
+            if needle in name_lc or needle in comment_lc[handle]
+        }
+
+    def category_index(self, category_name: str) -> QModelIndex:
+        """Get the index of a category row by name"""
+        for row, category in enumerate(self._categories):
+            if category.name == category_name:
+                return self.createIndex(row, 0, 0)
+
+        return QModelIndex()
+
+    def feature_indexes(self, feature_name: str) -> list:
+        """Get every index showing a feature (a feature may sit in several categories)"""
+        handle = self._handles.get(feature_name)
+        if handle is None:
+            return []
+
+        return [
+            self.createIndex(row, 0, cat_row + 1)
+            for cat_row, row in self._positions[handle]
+        ]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if index.internalId() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._categories[index.row()].name
+            return None
+
+        handle = self._rows[index.internalId() - 1][index.row()]
+        feature_name = self._names[handle]
+        feature_def = self._defs[handle]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return feature_name
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return self._CHECK_STATES[bool(feature_def.is_active)]
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # Tooltip with comment/description
+            return feature_def.comment or None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if feature_name in self._conflicts:
+                return self._CONFLICT_BRUSH
+            return None
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Handle feature checkbox change"""
+        feature_name = self.feature_name(index)
+        if feature_name is None or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        # Get new state
+        is_active = value in self._CHECKED_VALUES
+
+        # Emit change signal only when the state actually changed
+        if self.apply_state(feature_name, self.feature_def(index), is_active):
+            self.feature_toggled.emit(feature_name, is_active)
+
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.internalId() != 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return "Features"
+        return None
+
+    # Updates
+
+    def apply_state(self, feature_name: str, feature_def, is_active: bool) -> bool:
+        """
+        Record a feature's enabled state in the config and refresh its rows
+
+        Returns:
+            False if the feature already had this state
+        """
+        if feature_def.is_active == is_active:
+            return False
 
-    def update_check_state(self, is_active: bool):
-        """Update the checkbox state"""
         if is_active:
-            self.setCheckState(0, Qt.CheckState.Checked)
+            self.feature_config.active_features.add(feature_name)
         else:
-            self.setCheckState(0, Qt.CheckState.Unchecked)
+            self.feature_config.active_features.discard(feature_name)
+        feature_def.is_active = is_active
+
+        self.refresh_feature(feature_name)
+        return True
+
+    def refresh_feature(self, feature_name: str):
+        """Notify views that a feature's state changed"""
+        for index in self.feature_indexes(feature_name):
+            self.dataChanged.emit(index, index)
+
+    def set_conflicts(self, feature_names):
+        """Replace the set of highlighted features"""
+        changed = self._conflicts.symmetric_difference(feature_names)
+        self._conflicts = set(feature_names)
+
+        for feature_name in changed:
+            for index in self.feature_indexes(feature_name):
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.BackgroundRole])
+
+
+class FeatureFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters FeatureTreeModel rows by enabled state and search text
+
+    The search text is matched case-insensitively against the feature name
+    and its comment. Recursive filtering keeps a category visible while any
+    feature in it is accepted, and hides it otherwise.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.filter_mode = "all"  # all, enabled, disabled
+        self.search_text = ""  # current search text
+        self.matches = set()  # feature names matching search_text
+        self._filtering = False
+        self._accepts = self._build_predicate()
+        self.setRecursiveFilteringEnabled(True)
+        # Only re-filter when asked: toggling a feature under "Enabled Only" /
+        # "Disabled Only" keeps its row visible until the next filter pass
+        self.setDynamicSortFilter(False)
+
+    def set_filter(self, filter_mode: str, search_text: str, matches: set):
+        """Set the filter state; call invalidateFilter() afterwards to apply it"""
+        self.filter_mode = filter_mode
+        self.search_text = search_text
+        self.matches = matches
+        self._filtering = filter_mode != "all" or bool(search_text)
+        self._accepts = self._build_predicate()
+
+    def _build_predicate(self):
+        """Build the (feature_name, feature_def) test for this filter pass"""
+        matches = self.matches if self.search_text else None
+
+        if self.filter_mode == "enabled":
+            if matches is None:
+                return lambda name, feature_def: feature_def.is_active
+            return lambda name, feature_def: feature_def.is_active and name in matches
+
+        if self.filter_mode == "disabled":
+            if matches is None:
+                return lambda name, feature_def: not feature_def.is_active
+            return lambda name, feature_def: not feature_def.is_active and name in matches
+
+        if matches is None:
+            return lambda name, feature_def: True
+        return lambda name, feature_def: name in matches
+
+    def is_filtering(self) -> bool:
+        """Check whether any filter would hide rows"""
+        return self._filtering
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not source_parent.isValid():
+            # Categories are only accepted on their own when nothing is filtered
+            return not self._filtering
+
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+        return self._accepts(model.feature_name(index), model.feature_def(index))
 
 
 class FeatureSelectorWidget(QWidget):
@@ -56,8 +417,23 @@ class FeatureSelectorWidget(QWidget):
         super().__init__(parent)
 
         self.feature_config = None
-        self.feature_items = {}  # feature_name -> FeatureItem
-        self.category_items = {}  # category_name -> QTreeWidgetItem
+        self.model = FeatureTreeModel(self)
+        self.model.feature_toggled.connect(self._on_feature_toggled)
+        self.proxy = FeatureFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        # Debounce search so only the last keystroke in a burst filters the tree
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
+
+        # Coalesce statistics refreshes during bursts of checkbox changes
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(50)
+        self._stats_timer.timeout.connect(self._update_statistics)
 
         self._init_ui()
 
@@ -97,10 +473,9 @@ class FeatureSelectorWidget(QWidget):
         layout.addLayout(filter_layout)
 
         # Feature tree
-        self.feature_tree = QTreeWidget()
-        self.feature_tree.setHeaderLabel("Features")
+        self.feature_tree = QTreeView()
+        self.feature_tree.setModel(self.proxy)
         self.feature_tree.setAlternatingRowColors(True)
-        self.feature_tree.itemChanged.connect(self._on_item_changed)
         layout.addWidget(self.feature_tree)
 
         # Statistics
@@ -112,32 +487,37 @@ class FeatureSelectorWidget(QWidget):
         """Load features from configuration"""
         self.feature_config = feature_config
 
-        # Block signals while updating
-        self.feature_tree.blockSignals(True)
-
-        # Clear existing items
-        self.feature_tree.clear()
-        self.feature_items.clear()
-        self.category_items.clear()
-
-        # Create category items and feature items
-        for category in feature_config.categories:
-            # Create category item
-            category_item = QTreeWidgetItem([category.name])
-            category_item.setExpanded(True)
-            category_item.setFlags(category_item.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
-            self.feature_tree.addTopLevelItem(category_item)
-            self.category_items[category.name] = category_item
-
-            # Add features to category
-            for feature_name in category.features:
-                if feature_name in feature_config.features:
-                    feature_def = feature_config.features[feature_name]
-                    feature_item = FeatureItem(feature_name, feature_def, category_item)
-                    self.feature_items[feature_name] = feature_item
+        tree = self.feature_tree
+        tree.setUpdatesEnabled(False)
+
+        # Remember which categories were open so a reload keeps them open
+        expanded = set()
+        for row in range(self.proxy.rowCount()):
+            index = self.proxy.index(row, 0)
+            if tree.isExpanded(index):
+                expanded.add(index.data())
+
+        # Categories start collapsed so their rows are only fetched on expansion
+        self.model.load(feature_config)
+
+        # Expand after the reset in a single pass rather than per category
+        if self.proxy.is_filtering():
+            if self.proxy.search_text:
+                self.proxy.set_filter(
+                    self.proxy.filter_mode,
+                    self.proxy.search_text,
+                    self.model.match_features(self.proxy.search_text)
+                )
+            self.model.fetch_all()
+            self.proxy.invalidateFilter()
+            tree.expandAll()
+        else:
+            for row in range(self.proxy.rowCount()):
+                index = self.proxy.index(row, 0)
+                if index.data() in expanded:
+                    tree.expand(index)
 
-        # Re-enable signals
-        self.feature_tree.blockSignals(False)
+        tree.setUpdatesEnabled(True)
 
         # Update statistics
         self._update_statistics()
@@ -145,73 +525,44 @@ class FeatureSelectorWidget(QWidget):
         # Emit loaded signal
         self.features_loaded.emit()
 
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle feature checkbox change"""
-        if not isinstance(item, FeatureItem):
-            return
-
-        # Get new state
-        is_active = (item.checkState(0) == Qt.CheckState.Checked)
+    def _on_feature_toggled(self, feature_name: str, is_active: bool):
+        """Handle feature checkbox change from the model"""
+        self.feature_changed.emit(feature_name, is_active)
 
-        # Update feature config
-        if self.feature_config:
-            feature_name = item.feature_name
-            if is_active:
-                self.feature_config.active_features.add(feature_name)
-                item.feature_def.is_active = True
-            else:
-                self.feature_config.active_features.discard(feature_name)
-                item.feature_def.is_active = False
+        # Update statistics once the burst settles
+        self._stats_timer.start()
 
-            # Emit change signal
-            self.feature_changed.emit(feature_name, is_active)
+    def _refilter(self):
+        """Re-run the proxy filter and show every matching feature"""
+        # Filtering needs every category's rows, not just the expanded ones
+        if self.proxy.is_filtering():
+            self.model.fetch_all()
 
-            # Update statistics
-            self._update_statistics()
+        self.feature_tree.setUpdatesEnabled(False)
+        self.proxy.invalidateFilter()
+        if self.proxy.is_filtering():
+            self.feature_tree.expandAll()
+        self.feature_tree.setUpdatesEnabled(True)
 
     def _on_search_changed(self, text: str):
         """Handle search text change"""
-        search_text = text.lower()
-
-        for feature_name, item in self.feature_items.items():
-            # Check if feature matches search
-            matches = (
-                search_text in feature_name.lower() or
-                (item.feature_def.comment and search_text in item.feature_def.comment.lower())
-            )
-
-            # Show/hide item
-            item.setHidden(not matches)
-
-        # Show/hide categories based on visible children
-        for category_name, category_item in self.category_items.items():
-            has_visible_children = False
-            for i in range(category_item.childCount()):
-                if not category_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            category_item.setHidden(not has_visible_children)
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _apply_search(self):
+        """Filter the tree by the most recent search text"""
+        search_text = self._pending_search
+        if search_text and self.feature_config:
+            matches = self.model.match_features(search_text)
+        else:
+            matches = set()
+        self.proxy.set_filter(self.proxy.filter_mode, search_text, matches)
+        self._refilter()
 
     def _filter_view(self, filter_type: str):
         """Filter view to show all/enabled/disabled features"""
-        for feature_name, item in self.feature_items.items():
-            if filter_type == "all":
-                item.setHidden(False)
-            elif filter_type == "enabled":
-                item.setHidden(not item.feature_def.is_active)
-            elif filter_type == "disabled":
-                item.setHidden(item.feature_def.is_active)
-
-        # Show/hide categories
-        for category_name, category_item in self.category_items.items():
-            has_visible_children = False
-            for i in range(category_item.childCount()):
-                if not category_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            category_item.setHidden(not has_visible_children)
+        self.proxy.set_filter(filter_type, self.proxy.search_text, self.proxy.matches)
+        self._refilter()
 
     def _update_statistics(self):
         """Update the statistics label"""
@@ -229,16 +580,11 @@ class FeatureSelectorWidget(QWidget):
 
     def highlight_conflicts(self, conflicting_features: list):
         """Highlight features that have conflicts"""
-        for feature_name in conflicting_features:
-            if feature_name in self.feature_items:
-                item = self.feature_items[feature_name]
-                # Set red background for conflicting features
-                item.setBackground(0, QBrush(QColor(255, 200, 200)))
+        self.model.set_conflicts(set(conflicting_features))
 
     def clear_highlights(self):
         """Clear all conflict highlights"""
-        for item in self.feature_items.values():
-            item.setBackground(0, QBrush(Qt.GlobalColor.white))
+        self.model.set_conflicts(set())
 
     def get_enabled_features(self) -> set:
         """Get set of enabled feature names"""
@@ -253,34 +599,41 @@ class FeatureSelectorWidget(QWidget):
         Args:
             category_name: Name of the category to focus on
         """
-        if category_name in self.category_items:
-            category_item = self.category_items[category_name]
+        category_index = self.proxy.mapFromSource(self.model.category_index(category_name))
+        if not category_index.isValid():
+            return
 
-            # Collapse all other categories
-            for name, item in self.category_items.items():
-                item.setExpanded(name == category_name)
+        # Collapse all other categories
+        for row in range(self.proxy.rowCount()):
+            index = self.proxy.index(row, 0)
+            self.feature_tree.setExpanded(index, index == category_index)
 
-            # Scroll to the category
-            self.feature_tree.scrollToItem(category_item)
+        # Scroll to the category
+        self.feature_tree.scrollTo(category_index)
 
-            # Optionally highlight it temporarily
-            self.feature_tree.setCurrentItem(category_item)
+        # Optionally highlight it temporarily
+        self.feature_tree.setCurrentIndex(category_index)
 
     def set_feature_enabled(self, feature_name: str, enabled: bool):
         """Programmatically enable/disable a feature"""
-        if feature_name in self.feature_items:
-            item = self.feature_items[feature_name]
-            self.feature_tree.blockSignals(True)
-            item.update_check_state(enabled)
-            self.feature_tree.blockSignals(False)
-
-            # Update config
-            if self.feature_config:
-                if enabled:
-                    self.feature_config.active_features.add(feature_name)
-                    item.feature_def.is_active = True
-                else:
-                    self.feature_config.active_features.discard(feature_name)
-                    item.feature_def.is_active = False
-
-            self._update_statistics()
+        if not self.feature_config or feature_name not in self.feature_config.features:
+            return
+
+        # Update config
+        feature_def = self.feature_config.features[feature_name]
+        if self.model.apply_state(feature_name, feature_def, enabled):
+            self._stats_timer.start()
+
+    def bulk_set_features(self, states: dict):
+        """
+        Enable/disable many features at once (e.g. when applying a profile)
+
+        Args:
+            states: Mapping of feature name to enabled state
+        """
+        for feature_name, enabled in states.items():
+            self.set_feature_enabled(feature_name, enabled)
+
+        # Refresh statistics now instead of after the coalescing delay
+        self._stats_timer.stop()
+        self._update_statistics()
@@ -3,69 +3,353 @@ K3NG Configuration Tool - Pin Configurator Widget
 Displays and edits pin assignments in a table view
 """
 
+import re
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
     QLineEdit, QPushButton, QLabel, QComboBox, QCheckBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QModelIndex, QSortFilterProxyModel, QTimer
+)
+from PyQt6.QtGui import QBrush, QColor, QStandardItem, QStandardItemModel
 from typing import Optional
 
 from parsers.pin_parser import PinConfig, PinDefinition
 from boards.board_database import BoardDefinition
 
 
-class PinItem(QTreeWidgetItem):
-    """Custom tree widget item for a pin"""
+# Item data role on a pin's name item holding its is_disabled state
+PIN_DISABLED_ROLE = Qt.ItemDataRole.UserRole + 1
 
-    def __init__(self, pin_name: str, pin_def: PinDefinition, parent=None):
-        super().__init__(parent)
+# Shared brushes for pin and group rows
+_BRUSH_GRAY = QBrush(QColor(128, 128, 128))
+_BRUSH_BLACK = QBrush(QColor(0, 0, 0))
+_BRUSH_CONFLICT = QBrush(QColor(255, 200, 200))
+_BRUSH_WHITE = QBrush(Qt.GlobalColor.white)
+_BRUSH_GROUP = QBrush(QColor(230, 230, 250))
+
+# Item flags for read-only cells and the editable pin value cell
+_READONLY_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+_EDITABLE_FLAGS = _READONLY_FLAGS | Qt.ItemFlag.ItemIsEditable
+
+# Pin value forms: an analog pin (A0-A15) or a digital/remote pin number
+_PIN_VALUE_RE = re.compile(r"[Aa](\d{1,2})|(\d{1,3})")
+
+
+class PinItem(QStandardItem):
+    """Name column item for a pin row, owning the value and description items"""
+
+    def __init__(self, pin_name: str, pin_def: PinDefinition, group_item: QStandardItem):
+        super().__init__(pin_name)
         self.pin_name = pin_name
         self.pin_def = pin_def
-
-        # Column 0: Pin name
-        self.setText(0, pin_name)
+        self.group_item = group_item
+        self._update_search_blob()
 
         # Column 1: Pin value (editable)
-        self.setText(1, pin_def.pin_string)
+        self.value_item = QStandardItem(pin_def.pin_string)
 
         # Column 2: Description/comment
-        if pin_def.comment:
-            self.setText(2, pin_def.comment)
+        self.comment_item = QStandardItem(pin_def.comment or "")
 
         # Set tooltip
         tooltip = f"{pin_name}: {pin_def.pin_string}"
         if pin_def.comment:
             tooltip += f"\n{pin_def.comment}"
-        self.setToolTip(0, tooltip)
-        self.setToolTip(1, tooltip)
+        self.setToolTip(tooltip)
+        self.value_item.setToolTip(tooltip)
 
-        # Make pin value editable
-        self.setFlags(self.flags() | Qt.ItemFlag.ItemIsEditable)
+        # Only the pin value is editable
+        self.setFlags(_READONLY_FLAGS)
+        self.value_item.setFlags(_EDITABLE_FLAGS)
+        self.comment_item.setFlags(_READONLY_FLAGS)
+
+        self.setData(pin_def.is_disabled, PIN_DISABLED_ROLE)
 
         # Color disabled pins differently
         if pin_def.is_disabled:
-            self.setForeground(0, QBrush(QColor(128, 128, 128)))
-            self.setForeground(1, QBrush(QColor(128, 128, 128)))
-            self.setForeground(2, QBrush(QColor(128, 128, 128)))
+            self.setForeground(_BRUSH_GRAY)
+            self.value_item.setForeground(_BRUSH_GRAY)
+            self.comment_item.setForeground(_BRUSH_GRAY)
+
+    def row_items(self) -> list:
+        """Items making up this pin's row, in column order"""
+        return [self, self.value_item, self.comment_item]
+
+    def _update_search_blob(self):
+        """Lowercase the searchable columns once rather than per filter pass"""
+        self.search_blob = "\x00".join(
+            (self.pin_name, self.pin_def.pin_string, self.pin_def.comment or "")
+        ).lower()
 
     def update_value(self, new_value: str):
         """Update the pin value"""
-        self.setText(1, new_value)
         self.pin_def.pin_string = new_value
+        self._update_search_blob()
+
+        self.value_item.setText(new_value)
 
-        # Update disabled status
-        self.pin_def.is_disabled = (new_value == "0")
+        # Update disabled status; colors only change along with it
+        is_disabled = (new_value == "0")
+        if is_disabled == self.pin_def.is_disabled:
+            return
+        self.pin_def.is_disabled = is_disabled
+        self.setData(is_disabled, PIN_DISABLED_ROLE)
 
-        # Update color
-        if self.pin_def.is_disabled:
-            self.setForeground(0, QBrush(QColor(128, 128, 128)))
-            self.setForeground(1, QBrush(QColor(128, 128, 128)))
-            self.setForeground(2, QBrush(QColor(128, 128, 128)))
+        if is_disabled:
+            self.setForeground(_BRUSH_GRAY)
+            self.value_item.setForeground(_BRUSH_GRAY)
+            self.comment_item.setForeground(_BRUSH_GRAY)
         else:
-            self.setForeground(0, QBrush(QColor(0, 0, 0)))
-            self.setForeground(1, QBrush(QColor(0, 0, 0)))
-            self.setForeground(2, QBrush(QColor(0, 0, 0)))
+            self.setForeground(_BRUSH_BLACK)
+            self.value_item.setForeground(_BRUSH_BLACK)
+            self.comment_item.setForeground(_BRUSH_BLACK)
+
+
+class PinTreeModel(QStandardItemModel):
+    """
+    Pin groups as top-level rows with their pins as children
+
+    A group's pin rows are created when the view first expands it
+    (canFetchMore/fetchMore) or fetch_all() is called; until then the
+    model only holds the names of the group's pins.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHorizontalHeaderLabels(["Pin Name", "Value", "Description"])
+
+        self.pin_config = None
+        self.pin_items = {}  # pin_name -> PinItem, for fetched groups
+        self.group_items = {}  # group_name -> QStandardItem
+        self.pin_groups = {}  # pin_name -> group_name
+        self._pending = {}  # group_name -> names of pins not yet fetched
+        self._conflicts = set()
+
+    def load(self, pin_config: PinConfig):
+        """Rebuild the group rows for a pin configuration"""
+        self.removeRows(0, self.rowCount())
+        self.pin_config = pin_config
+        self.pin_items.clear()
+        self.group_items.clear()
+        self.pin_groups.clear()
+        self._pending.clear()
+        self._conflicts.clear()
+
+        for group in pin_config.groups:
+            # Create group row
+            group_row = [QStandardItem(group.name), QStandardItem(""), QStandardItem("")]
+            for item in group_row:
+                item.setFlags(_READONLY_FLAGS)
+                item.setBackground(_BRUSH_GROUP)
+            self.group_items[group.name] = group_row[0]
+
+            pin_names = [pin_name for pin_name in group.pins if pin_name in pin_config.pins]
+            for pin_name in pin_names:
+                self.pin_groups[pin_name] = group.name
+            if pin_names:
+                self._pending[group.name] = pin_names
+
+            self.appendRow(group_row)
+
+    def _is_pending_group(self, index: QModelIndex) -> bool:
+        return index.isValid() and not index.parent().isValid() and index.data() in self._pending
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # Unfetched groups still show an expand arrow
+        return self._is_pending_group(parent) or super().hasChildren(parent)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return self._is_pending_group(parent)
+
+    def fetchMore(self, parent: QModelIndex):
+        if self._is_pending_group(parent):
+            self._fetch_group(parent.data())
+
+    def _fetch_group(self, group_name: str):
+        """Create the pin rows of a group"""
+        group_item = self.group_items[group_name]
+        for pin_name in self._pending.pop(group_name):
+            pin_item = PinItem(pin_name, self.pin_config.pins[pin_name], group_item)
+            if pin_name in self._conflicts:
+                for item in pin_item.row_items():
+                    item.setBackground(_BRUSH_CONFLICT)
+            group_item.appendRow(pin_item.row_items())
+            self.pin_items[pin_name] = pin_item
+
+    def fetch_all(self):
+        """Create the pin rows of every group"""
+        for group_name in list(self._pending):
+            self._fetch_group(group_name)
+
+    def pending_pins(self, group_name: str) -> list:
+        """Names of a group's pins that have not been fetched yet"""
+        return self._pending.get(group_name, [])
+
+    def pin_item(self, pin_name: str) -> Optional[PinItem]:
+        """PinItem for a grouped pin, fetching its group if needed"""
+        group_name = self.pin_groups.get(pin_name)
+        if group_name in self._pending:
+            self._fetch_group(group_name)
+        return self.pin_items.get(pin_name)
+
+    def highlight(self, pin_names):
+        """Give pins the conflict background, now or once they are fetched"""
+        self._conflicts.update(pin_names)
+        for pin_name in pin_names:
+            if pin_name in self.pin_items:
+                for item in self.pin_items[pin_name].row_items():
+                    item.setBackground(_BRUSH_CONFLICT)
+
+    def clear_highlights(self):
+        """Reset every pin's background"""
+        self._conflicts.clear()
+        for pin_item in self.pin_items.values():
+            for item in pin_item.row_items():
+                item.setBackground(_BRUSH_WHITE)
+
+
+class PinFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters pin rows by search text and assigned/disabled state
+
+    A pin row is accepted when any of its columns or its group name contains
+    the search text. refresh() evaluates every pin once per filter change and
+    counts the accepted pins of each group, so filterAcceptsRow is a lookup
+    and a group is shown while its count is non-zero. Unfetched groups are
+    fetched before filtering, and count all their pins while unfiltered.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_mode = "all"
+        self.search_text = ""  # lowercased
+        self._accepted = set()  # names of accepted pins
+        self._visible_counts = {}  # group_name -> accepted pin count
+
+    def set_filter_mode(self, filter_mode: str) -> bool:
+        """Show all, assigned only or disabled only pins"""
+        self.filter_mode = filter_mode
+        return self.refresh()
+
+    def set_search_text(self, search_text: str) -> bool:
+        """
+        Show pins whose columns or group name contain the text
+
+        Extending the previous text can only reject accepted pins, and
+        shortening it can only accept rejected ones, so those edits re-test
+        just that side instead of every pin.
+        """
+        search_text = search_text.lower()
+        previous = self.search_text
+        if search_text == previous:
+            return False
+
+        self.search_text = search_text
+        if previous and search_text.startswith(previous):
+            return self._retest(list(self._accepted))
+        if previous.startswith(search_text):
+            pin_items = self.sourceModel().pin_items
+            return self._retest([name for name in pin_items if name not in self._accepted])
+        return self.refresh()
+
+    def is_filtering(self) -> bool:
+        """Whether any pins can currently be filtered out"""
+        return bool(self.search_text) or self.filter_mode != "all"
+
+    def _accepts(self, pin_item: PinItem, group_matches: bool) -> bool:
+        """Check a pin against the current filter"""
+        is_disabled = pin_item.data(PIN_DISABLED_ROLE)
+        if self.filter_mode == "assigned" and is_disabled:
+            return False
+        if self.filter_mode == "disabled" and not is_disabled:
+            return False
+
+        return group_matches or self.search_text in pin_item.search_blob
+
+    def refresh(self) -> bool:
+        """
+        Re-evaluate every pin against the filter
+
+        The filter is only invalidated, and True returned, when the set of
+        accepted pins actually changed.
+        """
+        model = self.sourceModel()
+        accepted = set()
+        visible_counts = {}
+
+        # Filtering needs every group's pins, not just the expanded ones
+        if self.is_filtering():
+            model.fetch_all()
+
+        for group_row in range(model.rowCount()):
+            group_item = model.item(group_row)
+            pending = model.pending_pins(group_item.text())
+            if pending:
+                accepted.update(pending)
+                visible_counts[group_item.text()] = len(pending)
+                continue
+
+            group_matches = self.search_text in group_item.text().lower()
+            count = 0
+            for row in range(group_item.rowCount()):
+                pin_item = group_item.child(row)
+                if self._accepts(pin_item, group_matches):
+                    accepted.add(pin_item.pin_name)
+                    count += 1
+            visible_counts[group_item.text()] = count
+
+        if accepted == self._accepted and visible_counts == self._visible_counts:
+            return False
+
+        self._accepted = accepted
+        self._visible_counts = visible_counts
+        self.invalidateFilter()
+        return True
+
+    def refresh_pin(self, pin_item: PinItem) -> bool:
+        """Re-evaluate a single pin after its value changed"""
+        return self._retest([pin_item.pin_name])
+
+    def _retest(self, pin_names: list) -> bool:
+        """
+        Re-evaluate some fetched pins against the filter
+
+        Only the group counts of pins whose state flips are adjusted, each
+        found through the pin's group back-pointer.
+        """
+        model = self.sourceModel()
+        group_matches = {
+            group_name: self.search_text in group_name.lower()
+            for group_name in model.group_items
+        }
+
+        changed = False
+        for pin_name in pin_names:
+            pin_item = model.pin_items[pin_name]
+            group_name = pin_item.group_item.text()
+            is_accepted = self._accepts(pin_item, group_matches[group_name])
+            if is_accepted == (pin_name in self._accepted):
+                continue
+
+            if is_accepted:
+                self._accepted.add(pin_name)
+                self._visible_counts[group_name] += 1
+            else:
+                self._accepted.discard(pin_name)
+                self._visible_counts[group_name] -= 1
+            changed = True
+
+        if changed:
+            self.invalidateFilter()
+        return changed
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        name = self.sourceModel().index(source_row, 0, source_parent).data()
+        if not source_parent.isValid():
+            return self._visible_counts.get(name, 0) > 0
+        return name in self._accepted
 
 
 class PinConfiguratorWidget(QWidget):
@@ -79,10 +363,14 @@ class PinConfiguratorWidget(QWidget):
         super().__init__(parent)
 
         self.pin_config = None
-        self.pin_items = {}  # pin_name -> PinItem
-        self.group_items = {}  # group_name -> QTreeWidgetItem
         self.selected_board: Optional[BoardDefinition] = None
 
+        # Debounce search so only the last keystroke in a burst filters the tree
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -99,7 +387,7 @@ class PinConfiguratorWidget(QWidget):
         search_label = QLabel("Search:")
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Filter pins...")
-        self.search_box.textChanged.connect(self._on_search_changed)
+        self.search_box.textChanged.connect(lambda: self._search_timer.start())
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_box)
         layout.addLayout(search_layout)
@@ -121,13 +409,18 @@ class PinConfiguratorWidget(QWidget):
         layout.addLayout(filter_layout)
 
         # Pin tree
-        self.pin_tree = QTreeWidget()
-        self.pin_tree.setHeaderLabels(["Pin Name", "Value", "Description"])
+        self.model = PinTreeModel(self)
+        self.model.itemChanged.connect(self._on_item_changed)
+
+        self.proxy = PinFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.pin_tree = QTreeView()
+        self.pin_tree.setModel(self.proxy)
         self.pin_tree.setAlternatingRowColors(True)
         self.pin_tree.setColumnWidth(0, 300)
         self.pin_tree.setColumnWidth(1, 100)
         self.pin_tree.setColumnWidth(2, 400)
-        self.pin_tree.itemChanged.connect(self._on_item_changed)
 
         # Add placeholder message for empty state
         self.empty_message = QLabel(
@@ -177,35 +470,35 @@ class PinConfiguratorWidget(QWidget):
         """Load pins from configuration"""
         self.pin_config = pin_config
 
-        # Block signals while updating
-        self.pin_tree.blockSignals(True)
-
-        # Clear existing items
-        self.pin_tree.clear()
-        self.pin_items.clear()
-        self.group_items.clear()
-
-        # Create group items and pin items
-        for group in pin_config.groups:
-            # Create group item
-            group_item = QTreeWidgetItem([group.name, "", ""])
-            group_item.setExpanded(True)
-            group_item.setFlags(group_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            group_item.setBackground(0, QBrush(QColor(230, 230, 250)))
-            group_item.setBackground(1, QBrush(QColor(230, 230, 250)))
-            group_item.setBackground(2, QBrush(QColor(230, 230, 250)))
-            self.pin_tree.addTopLevelItem(group_item)
-            self.group_items[group.name] = group_item
-
-            # Add pins to group
-            for pin_name in group.pins:
-                if pin_name in pin_config.pins:
-                    pin_def = pin_config.pins[pin_name]
-                    pin_item = PinItem(pin_name, pin_def, group_item)
-                    self.pin_items[pin_name] = pin_item
-
-        # Re-enable signals
-        self.pin_tree.blockSignals(False)
+        tree = self.pin_tree
+        sorting = tree.isSortingEnabled()
+        alternating = tree.alternatingRowColors()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        tree.setAlternatingRowColors(False)
+        try:
+            # Remember which groups were open so a reload keeps them open
+            expanded = set()
+            for row in range(self.proxy.rowCount()):
+                index = self.proxy.index(row, 0)
+                if tree.isExpanded(index):
+                    expanded.add(index.data())
+
+            # Groups start collapsed so their pins are only created on expansion
+            self.model.load(pin_config)
+            self.proxy.refresh()
+
+            if self.proxy.is_filtering():
+                tree.expandAll()
+            else:
+                for row in range(self.proxy.rowCount()):
+                    index = self.proxy.index(row, 0)
+                    if index.data() in expanded:
+                        tree.expand(index)
+        finally:
+            tree.setAlternatingRowColors(alternating)
+            tree.setSortingEnabled(sorting)
+            tree.setUpdatesEnabled(True)
 
         # Update statistics
         self._update_statistics()
@@ -216,116 +509,68 @@ class PinConfiguratorWidget(QWidget):
         # Emit loaded signal
         self.pins_loaded.emit()
 
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
+    def _on_item_changed(self, item: QStandardItem):
         """Handle pin value change"""
-        if not isinstance(item, PinItem):
+        # Only handle changes to column 1 (value)
+        if item.column() != 1:
             return
 
-        # Only handle changes to column 1 (value)
-        if column != 1:
+        pin_item = self.model.itemFromIndex(item.index().siblingAtColumn(0))
+        if not isinstance(pin_item, PinItem):
             return
 
-        # Get new value
-        new_value = item.text(1).strip()
+        # Get new value; ignore the change notification from our own updates
+        new_value = item.text().strip()
+        if new_value == pin_item.pin_def.pin_string:
+            return
 
         # Validate pin value
         if not self._validate_pin_value(new_value):
             # Revert to old value
-            item.setText(1, item.pin_def.pin_string)
+            item.setText(pin_item.pin_def.pin_string)
             return
 
         # Update pin config
         if self.pin_config:
-            pin_name = item.pin_name
-            old_value = item.pin_def.pin_string
-
             # Update the pin item
-            item.update_value(new_value)
+            pin_item.update_value(new_value)
+            self._refilter(lambda: self.proxy.refresh_pin(pin_item))
 
             # Emit change signal
-            self.pin_changed.emit(pin_name, new_value)
+            self.pin_changed.emit(pin_item.pin_name, new_value)
 
             # Update statistics
             self._update_statistics()
 
     def _validate_pin_value(self, value: str) -> bool:
         """Validate a pin value"""
-        if not value:
+        match = _PIN_VALUE_RE.fullmatch(value)
+        if not match:
             return False
 
-        # Allow 0 (disabled)
-        if value == "0":
-            return True
+        # Allow analog pins (A0-A15)
+        analog, number = match.groups()
+        if analog is not None:
+            return int(analog) <= 15
 
-        # Allow digital pins (numeric)
-        try:
-            pin_num = int(value)
-            # Most Arduino boards have pins 0-99
-            return 0 <= pin_num <= 99
-        except ValueError:
-            pass
+        # Allow 0 (disabled), digital pins (most Arduino boards have
+        # pins 0-99) and remote unit pins (100-200)
+        return int(number) <= 200
 
-        # Allow analog pins (A0-A15)
-        if value.startswith("A") or value.startswith("a"):
-            try:
-                analog_num = int(value[1:])
-                return 0 <= analog_num <= 15
-            except ValueError:
-                return False
-
-        # Allow remote unit pins (100+)
-        try:
-            pin_num = int(value)
-            return 100 <= pin_num <= 200
-        except ValueError:
-            pass
-
-        return False
-
-    def _on_search_changed(self, text: str):
-        """Handle search text change"""
-        search_text = text.lower()
-
-        for pin_name, item in self.pin_items.items():
-            # Check if pin matches search
-            matches = (
-                search_text in pin_name.lower() or
-                search_text in item.pin_def.pin_string.lower() or
-                (item.pin_def.comment and search_text in item.pin_def.comment.lower())
-            )
-
-            # Show/hide item
-            item.setHidden(not matches)
-
-        # Show/hide groups based on visible children
-        for group_name, group_item in self.group_items.items():
-            has_visible_children = False
-            for i in range(group_item.childCount()):
-                if not group_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            group_item.setHidden(not has_visible_children)
+    def _refilter(self, apply_filter):
+        """Change the proxy filter and re-expand the groups it shows"""
+        self.pin_tree.setUpdatesEnabled(False)
+        if apply_filter() and self.proxy.is_filtering():
+            self.pin_tree.expandAll()
+        self.pin_tree.setUpdatesEnabled(True)
+
+    def _apply_search(self):
+        """Filter the tree by the current search text"""
+        self._refilter(lambda: self.proxy.set_search_text(self.search_box.text()))
 
     def _filter_view(self, filter_type: str):
         """Filter view to show all/assigned/disabled pins"""
-        for pin_name, item in self.pin_items.items():
-            if filter_type == "all":
-                item.setHidden(False)
-            elif filter_type == "assigned":
-                item.setHidden(item.pin_def.is_disabled)
-            elif filter_type == "disabled":
-                item.setHidden(not item.pin_def.is_disabled)
-
-        # Show/hide groups
-        for group_name, group_item in self.group_items.items():
-            has_visible_children = False
-            for i in range(group_item.childCount()):
-                if not group_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            group_item.setHidden(not has_visible_children)
+        self._refilter(lambda: self.proxy.set_filter_mode(filter_type))
 
     def _update_statistics(self):
         """Update the statistics label"""
@@ -343,34 +588,26 @@ class PinConfiguratorWidget(QWidget):
 
     def highlight_conflicts(self, conflicting_pins: list):
         """Highlight pins that have conflicts"""
-        for pin_name in conflicting_pins:
-            if pin_name in self.pin_items:
-                item = self.pin_items[pin_name]
-                # Set red background for conflicting pins
-                item.setBackground(0, QBrush(QColor(255, 200, 200)))
-                item.setBackground(1, QBrush(QColor(255, 200, 200)))
-                item.setBackground(2, QBrush(QColor(255, 200, 200)))
+        self.model.highlight(conflicting_pins)
 
     def clear_highlights(self):
         """Clear all conflict highlights"""
-        for item in self.pin_items.values():
-            item.setBackground(0, QBrush(Qt.GlobalColor.white))
-            item.setBackground(1, QBrush(Qt.GlobalColor.white))
-            item.setBackground(2, QBrush(Qt.GlobalColor.white))
+        self.model.clear_highlights()
 
     def get_pin_value(self, pin_name: str) -> str:
         """Get the current value of a pin"""
-        if pin_name in self.pin_items:
-            return self.pin_items[pin_name].pin_def.pin_string
+        if pin_name in self.model.pin_groups:
+            return self.pin_config.pins[pin_name].pin_string
         return ""
 
     def set_pin_value(self, pin_name: str, value: str):
         """Programmatically set a pin value"""
-        if pin_name in self.pin_items and self._validate_pin_value(value):
-            item = self.pin_items[pin_name]
-            self.pin_tree.blockSignals(True)
-            item.update_value(value)
-            self.pin_tree.blockSignals(False)
+        if pin_name in self.model.pin_groups and self._validate_pin_value(value):
+            # update_value records the new value before the item changes,
+            # so _on_item_changed treats it as already applied
+            pin_item = self.model.pin_item(pin_name)
+            pin_item.update_value(value)
+            self._refilter(lambda: self.proxy.refresh_pin(pin_item))
             self._update_statistics()
 
     def set_board(self, board: BoardDefinition):
@@ -4,20 +4,71 @@ Provides serial terminal interface for K3NG controllers
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLineEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QLineEdit,
     QPushButton, QComboBox, QLabel, QGroupBox, QSpinBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QTextCursor, QColor, QTextCharFormat
+from collections import deque
 from datetime import datetime
+import functools
+import time
 
 from k3ng_serial.serial_manager import SerialManager, SerialPort
 from k3ng_serial.command_interface import K3NGCommandInterface
 
 
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(second: int) -> str:
+    """Format a Unix second as HH:MM:SS"""
+    return datetime.fromtimestamp(second).strftime("%H:%M:%S")
+
+
+def _timestamp() -> str:
+    """Current console timestamp, formatted once per second"""
+    return _format_timestamp(int(time.time()))
+
+
+def _make_fmt(color: str) -> QTextCharFormat:
+    """Build a console text format with the given foreground color"""
+    format = QTextCharFormat()
+    format.setForeground(QColor(color))
+    return format
+
+
+# Console text formats, shared by every append
+_FMT_TS = _make_fmt("#808080")
+_FMT_SYSTEM = _make_fmt("#9cdcfe")
+_FMT_TX_LABEL = _make_fmt("#4ec9b0")
+_FMT_TEXT = _make_fmt("#d4d4d4")
+_FMT_RX_LABEL = _make_fmt("#ce9178")
+_FMT_ERR = _make_fmt("#f48771")
+
+
 class SerialConsoleWidget(QWidget):
     """Widget for serial communication console"""
 
+    # Oldest lines are dropped once the console holds this many
+    MAX_CONSOLE_LINES = 5000
+
+    # Oldest commands are dropped once the history holds this many
+    MAX_HISTORY = 500
+
+    # Quick command templates: (label, command)
+    COMMAND_TEMPLATES = [
+        ("Query Azimuth (\\?AZ)", "\\?AZ"),
+        ("Query Elevation (\\?EL)", "\\?EL"),
+        ("Query Version (\\?CV)", "\\?CV"),
+        ("Calibration Status (\\?CAL)", "\\?CAL"),
+        ("Calibration Quality (\\?CQ)", "\\?CQ"),
+        ("Stop Rotation (S)", "S"),
+        ("Rotate CW (R)", "R"),
+        ("Rotate CCW (L)", "L"),
+        ("Rotate Up (U)", "U"),
+        ("Rotate Down (D)", "D"),
+        ("Help (H)", "H"),
+    ]
+
     # Signals
     connected = pyqtSignal(str)  # port
     disconnected = pyqtSignal()
@@ -31,13 +82,24 @@ class SerialConsoleWidget(QWidget):
         self.command_interface = K3NGCommandInterface(self.serial_manager)
 
         # Command history
-        self.command_history = []
+        self.command_history = deque(maxlen=self.MAX_HISTORY)
         self.history_index = -1
 
+        # Received lines are buffered and appended to the console together
+        self._rx_buffer = []
+        self._rx_timer = QTimer(self)
+        self._rx_timer.setSingleShot(True)
+        self._rx_timer.setInterval(33)
+        self._rx_timer.timeout.connect(self._flush_rx)
+
         # Connect signals
         self.serial_manager.connected.connect(self._on_connected)
         self.serial_manager.disconnected.connect(self._on_disconnected)
-        self.serial_manager.data_received.connect(self._on_data_received)
+        # Lines are emitted from the read thread; always deliver them queued
+        # and let _on_data_received do nothing but buffer them
+        self.serial_manager.data_received.connect(
+            self._on_data_received, Qt.ConnectionType.QueuedConnection
+        )
         self.serial_manager.error_occurred.connect(self._on_error)
         self.command_interface.command_sent.connect(self._on_command_sent)
 
@@ -117,9 +179,10 @@ class SerialConsoleWidget(QWidget):
         toolbar_layout.addStretch()
         console_layout.addLayout(toolbar_layout)
 
-        # Console text area
-        self.console_text = QTextEdit()
+        # Console text area (plain text layout, bounded to the newest lines)
+        self.console_text = QPlainTextEdit()
         self.console_text.setReadOnly(True)
+        self.console_text.setMaximumBlockCount(self.MAX_CONSOLE_LINES)
         self.console_text.setStyleSheet(
             "font-family: 'Courier New', monospace; "
             "font-size: 10pt; "
@@ -136,18 +199,9 @@ class SerialConsoleWidget(QWidget):
         # Command templates dropdown
         self.template_combo = QComboBox()
         self.template_combo.addItem("-- Quick Commands --")
-        self.template_combo.addItem("Query Azimuth (\\?AZ)")
-        self.template_combo.addItem("Query Elevation (\\?EL)")
-        self.template_combo.addItem("Query Version (\\?CV)")
-        self.template_combo.addItem("Calibration Status (\\?CAL)")
-        self.template_combo.addItem("Calibration Quality (\\?CQ)")
-        self.template_combo.addItem("Stop Rotation (S)")
-        self.template_combo.addItem("Rotate CW (R)")
-        self.template_combo.addItem("Rotate CCW (L)")
-        self.template_combo.addItem("Rotate Up (U)")
-        self.template_combo.addItem("Rotate Down (D)")
-        self.template_combo.addItem("Help (H)")
-        self.template_combo.currentTextChanged.connect(self._on_template_selected)
+        for label, command in self.COMMAND_TEMPLATES:
+            self.template_combo.addItem(label, command)
+        self.template_combo.currentIndexChanged.connect(self._on_template_selected)
         input_layout.addWidget(self.template_combo)
 
         # Command input field
@@ -234,9 +288,11 @@ class SerialConsoleWidget(QWidget):
         self._append_system_message("Disconnected")
         self.disconnected.emit()
 
-    def _on_data_received(self, data: str):
-        """Handle data received from serial port"""
-        self._append_received_message(data)
+    def _on_data_received(self, lines: list):
+        """Handle lines received from serial port"""
+        self._rx_buffer.extend(lines)
+        if not self._rx_timer.isActive():
+            self._rx_timer.start()
 
     def _on_error(self, error: str):
         """Handle serial error"""
@@ -275,11 +331,10 @@ class SerialConsoleWidget(QWidget):
         # Emit signal
         self.command_sent.emit(command)
 
-    def _on_template_selected(self, text: str):
+    def _on_template_selected(self, index: int):
         """Handle template selection"""
-        if " (" in text:
-            # Extract command from template
-            command = text.split("(")[1].split(")")[0]
+        command = self.template_combo.itemData(index)
+        if command:
             self.command_input.setText(command)
             self.command_input.setFocus()
 
@@ -288,69 +343,70 @@ class SerialConsoleWidget(QWidget):
 
     def _append_system_message(self, message: str):
         """Append system message to console"""
-        timestamp = datetime.now().strftime("%H:%M:%S") if self.timestamp_check.isChecked() else ""
-
-        format = QTextCharFormat()
-        format.setForeground(QColor("#808080"))
+        timestamp = _timestamp() if self.timestamp_check.isChecked() else ""
 
         if timestamp:
-            self._append_text(f"[{timestamp}] ", format)
+            self._append_text(f"[{timestamp}] ", _FMT_TS)
 
-        format.setForeground(QColor("#9cdcfe"))
-        self._append_text(f"[SYSTEM] {message}\n", format)
+        self._append_text(f"[SYSTEM] {message}\n", _FMT_SYSTEM)
 
     def _append_sent_message(self, message: str):
         """Append sent message to console"""
-        timestamp = datetime.now().strftime("%H:%M:%S") if self.timestamp_check.isChecked() else ""
-
-        format = QTextCharFormat()
-        format.setForeground(QColor("#808080"))
+        timestamp = _timestamp() if self.timestamp_check.isChecked() else ""
 
         if timestamp:
-            self._append_text(f"[{timestamp}] ", format)
+            self._append_text(f"[{timestamp}] ", _FMT_TS)
 
-        format.setForeground(QColor("#4ec9b0"))
-        self._append_text("TX: ", format)
+        self._append_text("TX: ", _FMT_TX_LABEL)
+        self._append_text(f"{message}\n", _FMT_TEXT)
 
-        format.setForeground(QColor("#d4d4d4"))
-        self._append_text(f"{message}\n", format)
-
-    def _append_received_message(self, message: str):
-        """Append received message to console"""
-        timestamp = datetime.now().strftime("%H:%M:%S") if self.timestamp_check.isChecked() else ""
+    def _flush_rx(self):
+        """Append all buffered received lines in a single console update"""
+        self._rx_timer.stop()
+        lines = self._rx_buffer
+        if not lines:
+            return
+        self._rx_buffer = []
 
-        format = QTextCharFormat()
-        format.setForeground(QColor("#808080"))
+        timestamp = _timestamp() if self.timestamp_check.isChecked() else ""
 
-        if timestamp:
-            self._append_text(f"[{timestamp}] ", format)
+        self.console_text.setUpdatesEnabled(False)
+        cursor = self.console_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
 
-        format.setForeground(QColor("#ce9178"))
-        self._append_text("RX: ", format)
+        for message in lines:
+            if timestamp:
+                cursor.insertText(f"[{timestamp}] ", _FMT_TS)
+            cursor.insertText("RX: ", _FMT_RX_LABEL)
+            cursor.insertText(f"{message}\n", _FMT_TEXT)
 
-        format.setForeground(QColor("#d4d4d4"))
-        self._append_text(f"{message}\n", format)
+        cursor.endEditBlock()
+        self._scroll_to(cursor)
+        self.console_text.setUpdatesEnabled(True)
 
     def _append_error_message(self, message: str):
         """Append error message to console"""
-        timestamp = datetime.now().strftime("%H:%M:%S") if self.timestamp_check.isChecked() else ""
-
-        format = QTextCharFormat()
-        format.setForeground(QColor("#808080"))
+        timestamp = _timestamp() if self.timestamp_check.isChecked() else ""
 
         if timestamp:
-            self._append_text(f"[{timestamp}] ", format)
+            self._append_text(f"[{timestamp}] ", _FMT_TS)
 
-        format.setForeground(QColor("#f48771"))
-        self._append_text(f"[ERROR] {message}\n", format)
+        self._append_text(f"[ERROR] {message}\n", _FMT_ERR)
 
     def _append_text(self, text: str, format: QTextCharFormat):
         """Append formatted text to console"""
+        # Keep console order: received lines still waiting for a flush go first
+        if self._rx_buffer:
+            self._flush_rx()
+
         cursor = self.console_text.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         cursor.insertText(text, format)
+        self._scroll_to(cursor)
 
-        # Auto-scroll if enabled
+    def _scroll_to(self, cursor: QTextCursor):
+        """Move the view to the cursor if auto-scroll is enabled"""
         if self.autoscroll_check.isChecked():
             self.console_text.setTextCursor(cursor)
             self.console_text.ensureCursorVisible()
@@ -374,8 +430,14 @@ class SerialConsoleWidget(QWidget):
 
         if filename:
             try:
+                # Write block by block rather than copying the whole console
                 with open(filename, 'w') as f:
-                    f.write(self.console_text.toPlainText())
+                    block = self.console_text.document().firstBlock()
+                    while block.isValid():
+                        f.write(block.text())
+                        block = block.next()
+                        if block.isValid():
+                            f.write("\n")
                 self._append_system_message(f"Log saved to {filename}")
             except Exception as e:
                 self._append_error_message(f"Failed to save log: {str(e)}")
@@ -3,75 +3,490 @@ K3NG Configuration Tool - Settings Editor Widget
 Displays and edits configuration settings in a tree view
 """
 
+from functools import partial
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-    QLineEdit, QPushButton, QLabel, QSpinBox, QDoubleSpinBox
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QAbstractItemView,
+    QLineEdit, QPushButton, QLabel
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractItemModel, QModelIndex, QPersistentModelIndex,
+    QSortFilterProxyModel, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor
 
 from parsers.settings_parser import SettingsConfig, SettingDefinition
 
 
-class SettingItem(QTreeWidgetItem):
-    """Custom tree widget item for a setting"""
+class SettingsModel(QAbstractItemModel):
+    """
+    Two-level item model of setting categories and their settings
 
-    def __init__(self, setting_name: str, setting_def: SettingDefinition, parent=None):
-        super().__init__(parent)
-        self.setting_name = setting_name
-        self.setting_def = setting_def
+    Rows read straight from the SettingsConfig, so no per-setting item
+    objects are created. Category indexes carry an internalId of 0;
+    setting indexes carry their category row + 1.
 
-        # Column 0: Setting name
-        self.setText(0, setting_name)
+    Each setting gets an integer handle into parallel arrays of names,
+    definitions, rendered value text and lowercased search blobs; category
+    rows store handles. Value text is rendered once per load and again only
+    when the model stores a new value.
 
-        # Column 1: Value (editable)
-        self.setText(1, str(setting_def.value))
+    Setting rows are fetched lazily: a category reports no rows until the
+    view expands it (canFetchMore/fetchMore) or fetch_all() is called.
+    Filtering works on handles, so it never needs the rows fetched.
+    """
 
-        # Column 2: Unit
-        if setting_def.unit:
-            self.setText(2, setting_def.unit)
+    # Signals
+    setting_changed = pyqtSignal(str, object)  # setting_name, new_value
 
-        # Column 3: Description/comment
-        if setting_def.comment:
-            self.setText(3, setting_def.comment)
+    COLUMNS = ["Setting Name", "Value", "Unit", "Description"]
+
+    # Shared backgrounds for category rows and EEPROM persistent settings
+    _CATEGORY_BRUSH = QBrush(QColor(200, 220, 255))
+    _EEPROM_BRUSH = QBrush(QColor(255, 255, 220))
+
+    # Converter and (low, high) sanity bounds chosen once per setting from
+    # the type of its parsed value. Most settings should be positive but
+    # some can be negative (like angle offsets). Other values are kept as
+    # the edited string and only need to be non-empty.
+    _INT_RULE = (int, (-32768, 32767))
+    _FLOAT_RULE = (float, (-1000000.0, 1000000.0))
+    _TEXT_RULE = (None, None)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.settings_config = None
+        self._categories = []  # SettingCategory per top-level row
+
+        # Per-setting arrays, indexed by handle
+        self._handles = {}  # setting_name -> handle
+        self._names = []
+        self._defs = []
+        self._value_text = []  # str(value), shown in the value column
+        self._search_lc = []  # lowercased name/value/unit/comment joined by NULs
+        self._converters = []  # int, float or None (keep the string)
+        self._bounds = []  # (low, high) or None
+        self._positions = []  # (category row, row) showing the setting
+
+        self._resolved = []  # setting handles per category row
+        self._rows = []  # fetched setting handles per category row
+        self._loaded = set()  # rows of categories whose settings are fetched
+
+    def load(self, settings_config: SettingsConfig):
+        """Reset the model to show the given configuration"""
+        self.beginResetModel()
 
-        # Set tooltip
-        tooltip = f"{setting_name} = {setting_def.value}"
+        self.settings_config = settings_config
+        self._categories = list(settings_config.categories)
+
+        self._handles = {}
+        self._names = []
+        self._defs = []
+        self._value_text = []
+        self._search_lc = []
+        self._converters = []
+        self._bounds = []
+        self._positions = []
+        self._resolved = []
+
+        for cat_row, category in enumerate(self._categories):
+            rows = []
+            for setting_def in category.setting_defs:
+                setting_name = setting_def.name
+                handle = len(self._names)
+                self._handles[setting_name] = handle
+                self._names.append(setting_name)
+                self._defs.append(setting_def)
+                value_text = str(setting_def.value)
+                self._value_text.append(value_text)
+                self._search_lc.append(self._build_search_blob(setting_name, value_text, setting_def))
+                converter, bounds = self._value_rule(setting_def.value)
+                self._converters.append(converter)
+                self._bounds.append(bounds)
+                self._positions.append((cat_row, len(rows)))
+                rows.append(handle)
+            self._resolved.append(rows)
+
+        self._rows = [[] for _ in self._categories]
+        self._loaded.clear()
+
+        self.endResetModel()
+
+    @classmethod
+    def _value_rule(cls, value):
+        if isinstance(value, int):
+            return cls._INT_RULE
+        if isinstance(value, float):
+            return cls._FLOAT_RULE
+        return cls._TEXT_RULE
+
+    @staticmethod
+    def _build_search_blob(setting_name: str, value_text: str,
+                           setting_def: SettingDefinition) -> str:
+        return (
+            f"{setting_name}\0{value_text}\0"
+            f"{setting_def.unit or ''}\0{setting_def.comment or ''}"
+        ).lower()
+
+    def _tooltip(self, handle: int) -> str:
+        """Build a setting's tooltip; only called when the view asks for one"""
+        setting_name = self._names[handle]
+        setting_def = self._defs[handle]
+
+        tooltip = f"{setting_name} = {self._value_text[handle]}"
         if setting_def.unit:
             tooltip += f" {setting_def.unit}"
         if setting_def.comment:
             tooltip += f"\n{setting_def.comment}"
         if setting_def.is_eeprom_persistent:
             tooltip += "\n[EEPROM Persistent]"
+        return tooltip
 
-        self.setToolTip(0, tooltip)
-        self.setToolTip(1, tooltip)
+    # Index navigation
 
-        # Make value editable
-        self.setFlags(self.flags() | Qt.ItemFlag.ItemIsEditable)
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
 
-        # Highlight EEPROM settings
-        if setting_def.is_eeprom_persistent:
-            self.setBackground(0, QBrush(QColor(255, 255, 220)))
-            self.setBackground(1, QBrush(QColor(255, 255, 220)))
-
-    def update_value(self, new_value):
-        """Update the setting value"""
-        self.setText(1, str(new_value))
-
-        # Try to convert to appropriate type
-        if isinstance(self.setting_def.value, int):
-            try:
-                self.setting_def.value = int(new_value)
-            except ValueError:
-                pass
-        elif isinstance(self.setting_def.value, float):
-            try:
-                self.setting_def.value = float(new_value)
-            except ValueError:
-                pass
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        if parent.internalId() == 0:
+            return self.createIndex(row, column, parent.row() + 1)
+
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._categories)
+
+        if parent.column() == 0 and parent.internalId() == 0:
+            return len(self._rows[parent.row()])
+
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._categories)
+
+        # Categories report children before they are fetched so they can expand
+        return (parent.column() == 0 and parent.internalId() == 0
+                and bool(self._resolved[parent.row()]))
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+
+        return parent.row() not in self._loaded
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+
+        cat_row = parent.row()
+        resolved = self._resolved[cat_row]
+
+        if resolved:
+            self.beginInsertRows(parent, 0, len(resolved) - 1)
+            self._rows[cat_row] = resolved
+            self._loaded.add(cat_row)
+            self.endInsertRows()
         else:
-            self.setting_def.value = new_value
+            self._loaded.add(cat_row)
+
+    def fetch_all(self):
+        """Fetch the rows of every category"""
+        for row in range(len(self._categories)):
+            self.fetchMore(self.createIndex(row, 0, 0))
+
+    # Lookups
+
+    def category_count(self) -> int:
+        return len(self._categories)
+
+    def setting_count(self) -> int:
+        return len(self._names)
+
+    def category_names(self) -> list:
+        return [category.name for category in self._categories]
+
+    def category_handles(self, cat_row: int) -> list:
+        """Get the setting handles under a category row, fetched or not"""
+        return self._resolved[cat_row]
+
+    def setting_def(self, setting_name: str):
+        """Get the definition of a shown setting, or None"""
+        handle = self._handles.get(setting_name)
+        if handle is None:
+            return None
+        return self._defs[handle]
+
+    def handle_def(self, handle: int) -> SettingDefinition:
+        return self._defs[handle]
+
+    def handle_name(self, handle: int) -> str:
+        return self._names[handle]
+
+    def search_blob(self, handle: int) -> str:
+        return self._search_lc[handle]
+
+    def _handle(self, index: QModelIndex):
+        if not index.isValid() or index.internalId() == 0:
+            return None
+        return self._rows[index.internalId() - 1][index.row()]
+
+    # Data
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if index.internalId() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                if index.column() == 0:
+                    return self._categories[index.row()].name
+                return None
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._CATEGORY_BRUSH
+            return None
+
+        handle = self._rows[index.internalId() - 1][index.row()]
+        setting_def = self._defs[handle]
+        column = index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 0:
+                return self._names[handle]
+            if column == 1:
+                return self._value_text[handle]
+            if column == 2:
+                return setting_def.unit or None
+            return setting_def.comment or None
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column <= 1:
+                return self._tooltip(handle)
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if column <= 1 and setting_def.is_eeprom_persistent:
+                return self._EEPROM_BRUSH
+            return None
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Handle setting value edit"""
+        handle = self._handle(index)
+        if handle is None or index.column() != 1 or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        # Validate and convert; rejecting the edit leaves the old value displayed
+        try:
+            converted_value = self.parse_value(handle, str(value).strip())
+        except ValueError:
+            return False
+
+        self._store_value(handle, converted_value)
+
+        # Emit change signal
+        self.setting_changed.emit(self._names[handle], converted_value)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.internalId() != 0 and index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    # Values
+
+    def parse_value(self, handle: int, value: str):
+        """
+        Convert text entered for a setting to the type of its value
+
+        Raises:
+            ValueError: If the text is empty, does not convert, or falls
+                outside the setting's sanity bounds
+        """
+        if not value:
+            raise ValueError("empty value")
+
+        converter = self._converters[handle]
+        if converter is None:
+            return value
+
+        converted = converter(value)
+        low, high = self._bounds[handle]
+        if not low <= converted <= high:
+            raise ValueError(f"{converted} outside {low}..{high}")
+        return converted
+
+    def _store_value(self, handle: int, value):
+        setting_def = self._defs[handle]
+        setting_def.value = value
+        value_text = str(value)
+        self._value_text[handle] = value_text
+        self._search_lc[handle] = self._build_search_blob(
+            self._names[handle], value_text, setting_def
+        )
+
+        cat_row, row = self._positions[handle]
+        if cat_row in self._loaded:
+            index = self.createIndex(row, 1, cat_row + 1)
+            self.dataChanged.emit(index, index)
+
+    def update_value(self, setting_name: str, new_value) -> bool:
+        """
+        Validate and store a new value for a setting without emitting
+        setting_changed
+
+        Returns:
+            True if the value was accepted
+        """
+        handle = self._handles.get(setting_name)
+        if handle is None:
+            return False
+
+        try:
+            converted_value = self.parse_value(handle, str(new_value))
+        except ValueError:
+            return False
+
+        # Values without a converter are stored as given, not as their text
+        if self._converters[handle] is None:
+            converted_value = new_value
+
+        self._store_value(handle, converted_value)
+        return True
+
+
+class SettingsFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters setting rows by search text, EEPROM persistence or category
+
+    set_rows_hidden() evaluates a predicate once per setting and keeps each
+    row's hidden state plus a count of visible settings per category, so
+    filterAcceptsRow is a lookup and a category is shown while its count is
+    non-zero. The filter is only invalidated when some row changed state.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_hidden = []  # per setting handle
+        self._category_hidden = []  # per category row
+        self._visible_counts = []  # visible settings per category row
+
+    def setSourceModel(self, model: SettingsModel):
+        # Connected ahead of the base class so the state matches the new rows
+        # by the time the proxy rebuilds its mapping after a reset
+        model.modelReset.connect(self._reset_state)
+        super().setSourceModel(model)
+        self._reset_state()
+
+    def _reset_state(self):
+        """Show every row of a freshly loaded source model"""
+        model = self.sourceModel()
+        self._row_hidden = [False] * model.setting_count()
+        self._category_hidden = [False] * model.category_count()
+        self._visible_counts = [
+            len(model.category_handles(cat_row)) for cat_row in range(model.category_count())
+        ]
+
+    def is_filtering(self) -> bool:
+        """Whether any category or setting is currently filtered out"""
+        return any(self._category_hidden) or any(self._row_hidden)
+
+    def set_rows_hidden(self, is_hidden) -> bool:
+        """
+        Hide or show every setting row, then hide categories left empty
+
+        Args:
+            is_hidden: Callable taking a setting handle, returning True for
+                rows to hide
+
+        Returns:
+            True if any row changed state
+        """
+        model = self.sourceModel()
+        row_hidden = self._row_hidden
+        visible_counts = self._visible_counts
+        changed = False
+
+        for cat_row in range(model.category_count()):
+            for handle in model.category_handles(cat_row):
+                hidden = is_hidden(handle)
+                if hidden != row_hidden[handle]:
+                    row_hidden[handle] = hidden
+                    visible_counts[cat_row] += -1 if hidden else 1
+                    changed = True
+
+            changed |= self._set_category_hidden(cat_row, visible_counts[cat_row] == 0)
+
+        if changed:
+            self.invalidateFilter()
+        return changed
+
+    def show_only_category(self, category_name: str) -> bool:
+        """
+        Show one category with all of its settings and hide the others
+
+        Returns:
+            True if any row changed state
+        """
+        model = self.sourceModel()
+        row_hidden = self._row_hidden
+        changed = False
+
+        for cat_row, cat_name in enumerate(model.category_names()):
+            if cat_name != category_name:
+                changed |= self._set_category_hidden(cat_row, True)
+                continue
+
+            changed |= self._set_category_hidden(cat_row, False)
+            handles = model.category_handles(cat_row)
+            for handle in handles:
+                if row_hidden[handle]:
+                    row_hidden[handle] = False
+                    changed = True
+            self._visible_counts[cat_row] = len(handles)
+
+        if changed:
+            self.invalidateFilter()
+        return changed
+
+    def _set_category_hidden(self, cat_row: int, hidden: bool) -> bool:
+        if hidden == self._category_hidden[cat_row]:
+            return False
+        self._category_hidden[cat_row] = hidden
+        return True
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not source_parent.isValid():
+            return not self._category_hidden[source_row]
+
+        handle = self.sourceModel().category_handles(source_parent.row())[source_row]
+        return not self._row_hidden[handle]
 
 
 class SettingsEditorWidget(QWidget):
@@ -85,8 +500,17 @@ class SettingsEditorWidget(QWidget):
         super().__init__(parent)
 
         self.settings_config = None
-        self.setting_items = {}  # setting_name -> SettingItem
-        self.category_items = {}  # category_name -> QTreeWidgetItem
+        self.model = SettingsModel(self)
+        self.model.setting_changed.connect(self.setting_changed)
+        self.proxy = SettingsFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self._category_indexes = {}  # category_name -> QPersistentModelIndex (source)
+
+        # Debounce search so filtering runs once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
 
         self._init_ui()
 
@@ -116,10 +540,10 @@ class SettingsEditorWidget(QWidget):
         self.show_motor_btn = QPushButton("Motor Settings")
         self.show_calib_btn = QPushButton("Calibration")
 
-        self.show_all_btn.clicked.connect(lambda: self._filter_view("all"))
-        self.show_eeprom_btn.clicked.connect(lambda: self._filter_view("eeprom"))
-        self.show_motor_btn.clicked.connect(lambda: self._filter_category("Motor Control"))
-        self.show_calib_btn.clicked.connect(lambda: self._filter_category("Calibration"))
+        self.show_all_btn.clicked.connect(partial(self._filter_view, "all"))
+        self.show_eeprom_btn.clicked.connect(partial(self._filter_view, "eeprom"))
+        self.show_motor_btn.clicked.connect(partial(self._filter_category, "Motor Control"))
+        self.show_calib_btn.clicked.connect(partial(self._filter_category, "Calibration"))
 
         filter_layout.addWidget(self.show_all_btn)
         filter_layout.addWidget(self.show_eeprom_btn)
@@ -129,14 +553,14 @@ class SettingsEditorWidget(QWidget):
         layout.addLayout(filter_layout)
 
         # Settings tree
-        self.settings_tree = QTreeWidget()
-        self.settings_tree.setHeaderLabels(["Setting Name", "Value", "Unit", "Description"])
+        self.settings_tree = QTreeView()
+        self.settings_tree.setModel(self.proxy)
+        self.settings_tree.setUniformRowHeights(True)
         self.settings_tree.setAlternatingRowColors(True)
         self.settings_tree.setColumnWidth(0, 350)
         self.settings_tree.setColumnWidth(1, 100)
         self.settings_tree.setColumnWidth(2, 80)
         self.settings_tree.setColumnWidth(3, 400)
-        self.settings_tree.itemChanged.connect(self._on_item_changed)
         layout.addWidget(self.settings_tree)
 
         # Help text
@@ -157,36 +581,24 @@ class SettingsEditorWidget(QWidget):
         """Load settings from configuration"""
         self.settings_config = settings_config
 
-        # Block signals while updating
-        self.settings_tree.blockSignals(True)
-
-        # Clear existing items
-        self.settings_tree.clear()
-        self.setting_items.clear()
-        self.category_items.clear()
-
-        # Create category items and setting items
-        for category in settings_config.categories:
-            # Create category item
-            category_item = QTreeWidgetItem([category.name, "", "", ""])
-            category_item.setExpanded(True)
-            category_item.setFlags(category_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            category_item.setBackground(0, QBrush(QColor(200, 220, 255)))
-            category_item.setBackground(1, QBrush(QColor(200, 220, 255)))
-            category_item.setBackground(2, QBrush(QColor(200, 220, 255)))
-            category_item.setBackground(3, QBrush(QColor(200, 220, 255)))
-            self.settings_tree.addTopLevelItem(category_item)
-            self.category_items[category.name] = category_item
-
-            # Add settings to category
-            for setting_name in category.settings:
-                if setting_name in settings_config.settings:
-                    setting_def = settings_config.settings[setting_name]
-                    setting_item = SettingItem(setting_name, setting_def, category_item)
-                    self.setting_items[setting_name] = setting_item
-
-        # Re-enable signals
-        self.settings_tree.blockSignals(False)
+        tree = self.settings_tree
+        sorting = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        try:
+            # A model reset replaces every row at once and drops hidden rows.
+            # Categories start collapsed so their settings are only fetched
+            # on expansion.
+            self.model.load(settings_config)
+        finally:
+            tree.setSortingEnabled(sorting)
+            tree.setUpdatesEnabled(True)
+
+        model = self.model
+        self._category_indexes = {
+            name: QPersistentModelIndex(model.index(row, 0))
+            for row, name in enumerate(model.category_names())
+        }
 
         # Update statistics
         self._update_statistics()
@@ -194,124 +606,43 @@ class SettingsEditorWidget(QWidget):
         # Emit loaded signal
         self.settings_loaded.emit()
 
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle setting value change"""
-        if not isinstance(item, SettingItem):
-            return
-
-        # Only handle changes to column 1 (value)
-        if column != 1:
-            return
-
-        # Get new value
-        new_value = item.text(1).strip()
-
-        # Validate value
-        if not self._validate_setting_value(item.setting_def, new_value):
-            # Revert to old value
-            item.setText(1, str(item.setting_def.value))
-            return
-
-        # Update setting config
-        if self.settings_config:
-            setting_name = item.setting_name
-            old_value = item.setting_def.value
-
-            # Convert to appropriate type
-            try:
-                if isinstance(old_value, int):
-                    converted_value = int(new_value)
-                elif isinstance(old_value, float):
-                    converted_value = float(new_value)
-                else:
-                    converted_value = new_value
-
-                # Update the setting item
-                item.update_value(converted_value)
-
-                # Emit change signal
-                self.setting_changed.emit(setting_name, converted_value)
-
-            except ValueError:
-                # Revert on conversion error
-                item.setText(1, str(old_value))
-
-    def _validate_setting_value(self, setting_def: SettingDefinition, value: str) -> bool:
-        """Validate a setting value"""
-        if not value:
-            return False
+    def _refilter(self, apply_filter):
+        """
+        Apply a filter change to the proxy and open what it left visible
 
-        try:
-            # Try to convert to the same type as the original value
-            if isinstance(setting_def.value, int):
-                int_value = int(value)
-                # Basic sanity check - most settings should be positive
-                # but some can be negative (like angle offsets)
-                return -32768 <= int_value <= 32767
-            elif isinstance(setting_def.value, float):
-                float_value = float(value)
-                return -1000000.0 <= float_value <= 1000000.0
-            else:
-                # String values are always valid
-                return True
-        except ValueError:
-            return False
+        expandAll() only reaches categories the proxy accepts, so settings
+        of filtered-out categories are never fetched.
+        """
+        if apply_filter() and self.proxy.is_filtering():
+            self.settings_tree.expandAll()
 
     def _on_search_changed(self, text: str):
         """Handle search text change"""
-        search_text = text.lower()
-
-        for setting_name, item in self.setting_items.items():
-            # Check if setting matches search
-            matches = (
-                search_text in setting_name.lower() or
-                search_text in str(item.setting_def.value).lower() or
-                (item.setting_def.unit and search_text in item.setting_def.unit.lower()) or
-                (item.setting_def.comment and search_text in item.setting_def.comment.lower())
-            )
-
-            # Show/hide item
-            item.setHidden(not matches)
-
-        # Show/hide categories based on visible children
-        for category_name, category_item in self.category_items.items():
-            has_visible_children = False
-            for i in range(category_item.childCount()):
-                if not category_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            category_item.setHidden(not has_visible_children)
+        self._search_timer.start()
+
+    def _apply_search(self):
+        """Filter the tree by the current search text"""
+        search_text = self.search_box.text().lower()
+        search_blob = self.model.search_blob
+
+        # Check if setting matches search
+        self._refilter(lambda: self.proxy.set_rows_hidden(
+            lambda handle: search_text not in search_blob(handle)
+        ))
 
     def _filter_view(self, filter_type: str):
         """Filter view to show all/eeprom settings"""
-        for setting_name, item in self.setting_items.items():
-            if filter_type == "all":
-                item.setHidden(False)
-            elif filter_type == "eeprom":
-                item.setHidden(not item.setting_def.is_eeprom_persistent)
-
-        # Show/hide categories
-        for category_name, category_item in self.category_items.items():
-            has_visible_children = False
-            for i in range(category_item.childCount()):
-                if not category_item.child(i).isHidden():
-                    has_visible_children = True
-                    break
-
-            category_item.setHidden(not has_visible_children)
+        if filter_type == "all":
+            self._refilter(lambda: self.proxy.set_rows_hidden(lambda handle: False))
+        elif filter_type == "eeprom":
+            handle_def = self.model.handle_def
+            self._refilter(lambda: self.proxy.set_rows_hidden(
+                lambda handle: not handle_def(handle).is_eeprom_persistent
+            ))
 
     def _filter_category(self, category_name: str):
         """Show only settings from a specific category"""
-        # Hide all categories except the selected one
-        for cat_name, category_item in self.category_items.items():
-            if cat_name == category_name:
-                category_item.setHidden(False)
-                # Show all children
-                for i in range(category_item.childCount()):
-                    category_item.child(i).setHidden(False)
-            else:
-                category_item.setHidden(True)
+        self._refilter(lambda: self.proxy.show_only_category(category_name))
 
     def _update_statistics(self):
         """Update the statistics label"""
@@ -333,31 +664,32 @@ class SettingsEditorWidget(QWidget):
         Args:
             category_name: Name of the category to focus on
         """
-        if category_name in self.category_items:
-            category_item = self.category_items[category_name]
+        source_index = self._category_indexes.get(category_name)
+        if source_index is None:
+            return
+
+        category_index = self.proxy.mapFromSource(QModelIndex(source_index))
+        if not category_index.isValid():
+            return
 
-            # Collapse all other categories
-            for name, item in self.category_items.items():
-                item.setExpanded(name == category_name)
+        # Collapse all other categories in one recursive pass
+        self.settings_tree.collapseAll()
+        self.settings_tree.expand(category_index)
 
-            # Scroll to the category
-            self.settings_tree.scrollToItem(category_item)
+        # Scroll to the category
+        self.settings_tree.scrollTo(category_index, QAbstractItemView.ScrollHint.PositionAtCenter)
 
-            # Highlight it
-            self.settings_tree.setCurrentItem(category_item)
+        # Highlight it
+        self.settings_tree.setCurrentIndex(category_index)
 
     def get_setting_value(self, setting_name: str):
         """Get the current value of a setting"""
-        if setting_name in self.setting_items:
-            return self.setting_items[setting_name].setting_def.value
+        setting_def = self.model.setting_def(setting_name)
+        if setting_def is not None:
+            return setting_def.value
         return None
 
     def set_setting_value(self, setting_name: str, value):
         """Programmatically set a setting value"""
-        if setting_name in self.setting_items:
-            item = self.setting_items[setting_name]
-            if self._validate_setting_value(item.setting_def, str(value)):
-                self.settings_tree.blockSignals(True)
-                item.update_value(value)
-                self.settings_tree.blockSignals(False)
-                self._update_statistics()
+        if self.model.update_value(setting_name, value):
+            self._update_statistics()
@@ -8,30 +8,85 @@ from PyQt6.QtWidgets import (
     QPushButton, QTreeWidget, QTreeWidgetItem, QTextEdit,
     QProgressBar, QLabel, QCheckBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QColor, QFont, QPalette, QTextCursor, QTextBlock
 from pathlib import Path
 from datetime import datetime
 
 from testing.test_engine import TestEngine, create_test_registry
 from testing.test_base import TestResult, TestStatus, TestSuiteResult
+from testing.report_generator import generate_html_report
 
+# Results view text color per test status; anything else is gray
+_STATUS_COLORS = {
+    TestStatus.PASSED: "green",
+    TestStatus.FAILED: "red",
+    TestStatus.SKIPPED: "orange",
+}
 
-class TestRunnerThread(QThread):
-    """Thread for running tests without blocking UI"""
 
-    finished = pyqtSignal(TestSuiteResult)
+def _format_suite_summary(result: TestSuiteResult) -> str:
+    """Render the results view's end-of-suite summary as one HTML paragraph"""
+    return "<br>".join([
+        "",
+        "="*60,
+        "<b>Test Suite Complete</b>",
+        f"Total: {result.total_tests}",
+        f'<span style="color: green">Passed: {result.passed_tests}</span>',
+        f'<span style="color: red">Failed: {result.failed_tests}</span>',
+        f'<span style="color: orange">Skipped: {result.skipped_tests}</span>',
+        f"Success Rate: {result.success_rate:.1f}%",
+        f"Duration: {result.duration:.2f}s",
+    ])
+
+
+class TestRunnerSignals(QObject):
+    """Signals for TestRunnerTask (QRunnable is not a QObject)"""
+
+    finished = pyqtSignal(TestSuiteResult, str)  # result, summary HTML
+
+
+class TestRunnerTask(QRunnable):
+    """Pool task for running tests without blocking UI"""
 
     def __init__(self, test_engine, tests, suite_name):
         super().__init__()
+        self.signals = TestRunnerSignals()
         self.test_engine = test_engine
         self.tests = tests
         self.suite_name = suite_name
 
     def run(self):
-        """Run tests in thread"""
+        """Run tests on a pool thread"""
         result = self.test_engine.run_tests(self.tests, self.suite_name)
-        self.finished.emit(result)
+        # Tally and format the summary here rather than on the GUI thread
+        self.signals.finished.emit(result, _format_suite_summary(result))
+
+
+class ReportTaskSignals(QObject):
+    """Signals for ReportTask"""
+
+    finished = pyqtSignal(str)  # filename
+    failed = pyqtSignal(str)  # error message
+
+
+class ReportTask(QRunnable):
+    """Pool task for writing an HTML test report without blocking UI"""
+
+    def __init__(self, result: TestSuiteResult, filename: str):
+        super().__init__()
+        self.signals = ReportTaskSignals()
+        self.result = result
+        self.filename = filename
+
+    def run(self):
+        """Render and write the report on a pool thread"""
+        try:
+            generate_html_report(self.result, self.filename)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filename)
 
 
 class TestRunnerWidget(QWidget):
@@ -41,6 +96,9 @@ class TestRunnerWidget(QWidget):
     tests_started = pyqtSignal()
     tests_completed = pyqtSignal(TestSuiteResult)
 
+    # Paragraphs kept in the results view before the oldest are dropped
+    MAX_RESULT_BLOCKS = 5000
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -48,7 +106,21 @@ class TestRunnerWidget(QWidget):
         self.test_registry = None
         self.command_interface = None
         self.current_result: TestSuiteResult = None
-        self.runner_thread = None
+        self.runner_task = None
+        self.report_task = None
+
+        # One long-lived worker thread, reused by every run; a single thread
+        # also keeps two runs from driving the serial port at once
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.thread_pool.setExpiryTimeout(-1)
+
+        # Tests in tree order, and the ones currently checked
+        self._all_tests = []
+        self._selected = set()
+
+        # Results line showing the test currently running
+        self._pending_block = QTextBlock()
 
         # Connect test engine signals
         self.test_engine.test_started.connect(self._on_test_started)
@@ -81,6 +153,7 @@ class TestRunnerWidget(QWidget):
         self.test_tree = QTreeWidget()
         self.test_tree.setHeaderLabel("Tests")
         self.test_tree.setSelectionMode(QTreeWidget.SelectionMode.MultiSelection)
+        self.test_tree.itemChanged.connect(self._on_test_item_changed)
         test_layout.addWidget(self.test_tree)
 
         # Selection buttons
@@ -135,13 +208,30 @@ class TestRunnerWidget(QWidget):
         self.results_text.setReadOnly(True)
         self.results_text.setFont(QFont("Courier New", 9))
         self.results_text.setPlaceholderText("Test results will appear here...")
+        # Keep long runs cheap: drop the oldest paragraphs and skip the undo stack
+        self.results_text.document().setMaximumBlockCount(self.MAX_RESULT_BLOCKS)
+        self.results_text.setUndoRedoEnabled(False)
         layout.addWidget(self.results_text)
 
         # Status label
+        # Colored through prebuilt palettes so a result only swaps the palette
+        # instead of re-parsing a stylesheet
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("padding: 5px; background-color: #f0f0f0;")
+        self.status_label.setMargin(5)
+        self.status_label.setAutoFillBackground(True)
+        self._passed_palette = self._status_palette("#c8e6c9", "#2e7d32")
+        self._failed_palette = self._status_palette("#ffccbc", "#c62828")
+        self.status_label.setPalette(self._status_palette("#f0f0f0"))
         layout.addWidget(self.status_label)
 
+    def _status_palette(self, background: str, foreground: str = None) -> QPalette:
+        """Build a status label palette with the given background/text colors"""
+        palette = QPalette(self.status_label.palette())
+        palette.setColor(QPalette.ColorRole.Window, QColor(background))
+        if foreground:
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(foreground))
+        return palette
+
     def set_command_interface(self, command_interface):
         """
         Set the command interface for serial tests
@@ -164,61 +254,89 @@ class TestRunnerWidget(QWidget):
     def _populate_test_tree(self):
         """Populate the test tree with available tests"""
         self.test_tree.clear()
+        self._all_tests = []
+        self._selected = set()
 
         if not self.test_registry:
             return
 
-        for category in self.test_registry.categories:
-            # Create category item
-            category_item = QTreeWidgetItem(self.test_tree)
-            category_item.setText(0, f"{category.name} ({len(category.tests)} tests)")
-            category_item.setExpanded(True)
-            category_item.setFlags(category_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            category_item.setCheckState(0, Qt.CheckState.Unchecked)
-
-            # Add test items
-            for test in category.tests:
-                test_item = QTreeWidgetItem(category_item)
-                test_item.setText(0, test.name)
-                test_item.setData(0, Qt.ItemDataRole.UserRole, test)
-                test_item.setFlags(test_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                test_item.setCheckState(0, Qt.CheckState.Unchecked)
+        tree = self.test_tree
+        was_visible = tree.isVisible()
+        sorting = tree.isSortingEnabled()
+        if was_visible:
+            tree.hide()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        tree.blockSignals(True)
+        try:
+            # Build the items detached from the tree and insert them in one batch
+            category_items = []
+            for category in self.test_registry.categories:
+                # Create category item
+                category_item = QTreeWidgetItem()
+                category_item.setText(0, f"{category.name} ({len(category.tests)} tests)")
+                category_item.setFlags(category_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                category_item.setCheckState(0, Qt.CheckState.Unchecked)
+
+                # Add test items
+                for test in category.tests:
+                    test_item = QTreeWidgetItem(category_item)
+                    test_item.setText(0, test.name)
+                    test_item.setData(0, Qt.ItemDataRole.UserRole, test)
+                    test_item.setFlags(test_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                    test_item.setCheckState(0, Qt.CheckState.Unchecked)
+                    self._all_tests.append(test)
+
+                category_items.append(category_item)
+
+            tree.addTopLevelItems(category_items)
+            # Expansion only sticks once the items are in the tree
+            tree.expandAll()
+        finally:
+            tree.blockSignals(False)
+            tree.setSortingEnabled(sorting)
+            tree.setUpdatesEnabled(True)
+            if was_visible:
+                tree.show()
+
+    def _on_test_item_changed(self, item: QTreeWidgetItem, column: int):
+        """Track the checked state of a test item"""
+        test = item.data(0, Qt.ItemDataRole.UserRole)
+        if test is None:
+            return
+
+        if item.checkState(0) == Qt.CheckState.Checked:
+            self._selected.add(test)
+        else:
+            self._selected.discard(test)
+
+    def _set_all_check_states(self, state: Qt.CheckState):
+        """Check or uncheck every category and test item"""
+        self.test_tree.blockSignals(True)
+        try:
+            root = self.test_tree.invisibleRootItem()
+            for i in range(root.childCount()):
+                category_item = root.child(i)
+                category_item.setCheckState(0, state)
+                for j in range(category_item.childCount()):
+                    category_item.child(j).setCheckState(0, state)
+        finally:
+            self.test_tree.blockSignals(False)
 
     def _select_all_tests(self):
         """Select all tests"""
-        root = self.test_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            category_item = root.child(i)
-            category_item.setCheckState(0, Qt.CheckState.Checked)
-            for j in range(category_item.childCount()):
-                test_item = category_item.child(j)
-                test_item.setCheckState(0, Qt.CheckState.Checked)
+        self._set_all_check_states(Qt.CheckState.Checked)
+        self._selected = set(self._all_tests)
 
     def _deselect_all_tests(self):
         """Deselect all tests"""
-        root = self.test_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            category_item = root.child(i)
-            category_item.setCheckState(0, Qt.CheckState.Unchecked)
-            for j in range(category_item.childCount()):
-                test_item = category_item.child(j)
-                test_item.setCheckState(0, Qt.CheckState.Unchecked)
+        self._set_all_check_states(Qt.CheckState.Unchecked)
+        self._selected = set()
 
     def _get_selected_tests(self):
-        """Get list of selected tests"""
-        selected_tests = []
-        root = self.test_tree.invisibleRootItem()
-
-        for i in range(root.childCount()):
-            category_item = root.child(i)
-            for j in range(category_item.childCount()):
-                test_item = category_item.child(j)
-                if test_item.checkState(0) == Qt.CheckState.Checked:
-                    test = test_item.data(0, Qt.ItemDataRole.UserRole)
-                    if test:
-                        selected_tests.append(test)
-
-        return selected_tests
+        """Get list of selected tests, in tree order"""
+        selected = self._selected
+        return [test for test in self._all_tests if test in selected]
 
     def _run_selected_tests(self):
         """Run selected tests"""
@@ -234,6 +352,7 @@ class TestRunnerWidget(QWidget):
 
         # Clear results
         self.results_text.clear()
+        self._pending_block = QTextBlock()
         self.current_result = None
 
         # Update UI
@@ -247,75 +366,89 @@ class TestRunnerWidget(QWidget):
         # Emit signal
         self.tests_started.emit()
 
-        # Run tests in thread
+        # Run tests on the worker thread
         suite_name = f"K3NG Hardware Tests - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        self.runner_thread = TestRunnerThread(self.test_engine, selected_tests, suite_name)
-        self.runner_thread.finished.connect(self._on_thread_finished)
-        self.runner_thread.start()
+        self.runner_task = TestRunnerTask(self.test_engine, selected_tests, suite_name)
+        self.runner_task.signals.finished.connect(self._on_thread_finished)
+        self.thread_pool.start(self.runner_task)
 
     def _stop_tests(self):
         """Stop test execution"""
         self.test_engine.stop()
         self.status_label.setText("Stopping tests...")
 
+    def _append_html(self, html: str) -> QTextBlock:
+        """
+        Append a paragraph of HTML to the results as a single edit
+
+        Returns:
+            The block holding the new paragraph
+        """
+        results = self.results_text
+        scrollbar = results.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        document = results.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not document.isEmpty():
+            cursor.insertBlock()
+        cursor.insertHtml(html)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        return cursor.block()
+
     def _on_test_started(self, test_name: str):
         """Handle test started"""
         self.status_label.setText(f"Running: {test_name}")
-        self.results_text.append(f"\n⟳ {test_name}...")
+        self._pending_block = self._append_html(f"<br>⟳ {test_name}...")
 
     def _on_test_completed(self, result: TestResult):
         """Handle test completed"""
-        # Update last line with result
-        cursor = self.results_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        cursor.removeSelectedText()
-
         # Add result with color
         result_text = str(result)
-        if result.passed():
-            color = "green"
-        elif result.failed():
-            color = "red"
-        elif result.skipped():
-            color = "orange"
-        else:
-            color = "gray"
+        color = _STATUS_COLORS.get(result.status, "gray")
 
-        self.results_text.append(f'<span style="color: {color}">{result_text}</span>')
+        html = f'<br><span style="color: {color}">{result_text}</span>'
+
+        # Overwrite the running test's line in place
+        block = self._pending_block
+        self._pending_block = QTextBlock()
+        if not block.isValid():
+            self._append_html(html)
+            return
+
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock,
+                            QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertHtml(html)
 
     def _on_suite_started(self, suite_name: str):
         """Handle suite started"""
-        self.results_text.append(f"<b>Starting: {suite_name}</b>")
-        self.results_text.append("="*60)
+        self._append_html(f"<b>Starting: {suite_name}</b><br>" + "="*60)
 
     def _on_suite_completed(self, result: TestSuiteResult):
         """Handle suite completed"""
         self.current_result = result
 
-        self.results_text.append("\n" + "="*60)
-        self.results_text.append(f"<b>Test Suite Complete</b>")
-        self.results_text.append(f"Total: {result.total_tests}")
-        self.results_text.append(f'<span style="color: green">Passed: {result.passed_tests}</span>')
-        self.results_text.append(f'<span style="color: red">Failed: {result.failed_tests}</span>')
-        self.results_text.append(f'<span style="color: orange">Skipped: {result.skipped_tests}</span>')
-        self.results_text.append(f"Success Rate: {result.success_rate:.1f}%")
-        self.results_text.append(f"Duration: {result.duration:.2f}s")
-
         # Update status
         if result.all_passed():
             self.status_label.setText("✓ All tests passed!")
-            self.status_label.setStyleSheet("padding: 5px; background-color: #c8e6c9; color: #2e7d32;")
+            self.status_label.setPalette(self._passed_palette)
         else:
             self.status_label.setText(f"✗ {result.failed_tests} test(s) failed")
-            self.status_label.setStyleSheet("padding: 5px; background-color: #ffccbc; color: #c62828;")
+            self.status_label.setPalette(self._failed_palette)
 
     def _on_progress_updated(self, current: int, total: int):
         """Handle progress update"""
         self.progress_bar.setValue(current)
 
-    def _on_thread_finished(self):
-        """Handle thread finished"""
+    def _on_thread_finished(self, result: TestSuiteResult, summary_html: str):
+        """Handle the worker finishing a run"""
+        self.runner_task = None
+        self._append_html(summary_html)
+
         # Re-enable UI
         self.run_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -339,9 +472,25 @@ class TestRunnerWidget(QWidget):
         )
 
         if filename:
-            try:
-                from testing.report_generator import generate_html_report
-                generate_html_report(self.current_result, filename)
-                self.status_label.setText(f"Report saved to {filename}")
-            except Exception as e:
-                self.status_label.setText(f"Failed to generate report: {str(e)}")
+            # Written on the worker thread; the button stays off until it is done
+            self.report_btn.setEnabled(False)
+            self.status_label.setText(f"Generating report: {filename}")
+            self.report_task = ReportTask(self.current_result, filename)
+            self.report_task.signals.finished.connect(self._on_report_finished)
+            self.report_task.signals.failed.connect(self._on_report_failed)
+            self.thread_pool.start(self.report_task)
+
+    def _on_report_finished(self, filename: str):
+        """Handle the report being written"""
+        self.report_task = None
+        # A run queued behind the report owns the button and status until it ends
+        if self.runner_task is None:
+            self.report_btn.setEnabled(True)
+            self.status_label.setText(f"Report saved to {filename}")
+
+    def _on_report_failed(self, error: str):
+        """Handle report generation failing"""
+        self.report_task = None
+        if self.runner_task is None:
+            self.report_btn.setEnabled(True)
+            self.status_label.setText(f"Failed to generate report: {error}")
@@ -4,13 +4,18 @@ Display validation errors, warnings, and info with auto-fix capabilities
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QTreeWidget, QTreeWidgetItem, QPushButton, QLabel,
-    QMessageBox, QMenu, QFileDialog
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
+    QTreeView, QPushButton, QLabel,
+    QMessageBox, QMenu, QFileDialog, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QColor, QAction
-from typing import Optional, List
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractItemModel, QModelIndex
+)
+from PyQt6.QtGui import QIcon, QColor, QAction, QBrush, QPalette
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Optional, List, Iterator
 from pathlib import Path
 
 from validators.dependency_validator import (
@@ -19,6 +24,323 @@ from validators.dependency_validator import (
     ValidationSeverity
 )
 
+# Role answered with a {role: value} dict of every paint role at once
+MultipleRolesRole = Qt.ItemDataRole.UserRole + 1
+
+# Enum members used on the data()/paint paths, resolved once
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_SEV_ERR = ValidationSeverity.ERROR
+_SEV_WARN = ValidationSeverity.WARNING
+
+
+@lru_cache(maxsize=1024)
+def _decorate(prefix: str, text: str) -> str:
+    """Display text for an issue row or suggestion, memoized per string"""
+    return f"{prefix}{text}"
+
+
+def _format_issue(number: int, issue: ValidationIssue) -> Iterator[str]:
+    """Yield the report lines for one numbered issue"""
+    yield f"{number}. {issue.message}"
+    if issue.affected_features:
+        yield f"   Affects: {', '.join(issue.affected_features)}"
+    if issue.suggestion:
+        yield f"   Suggestion: {issue.suggestion}"
+    yield ""
+
+
+def _format_section(title: str, issues: List[ValidationIssue]) -> Iterator[str]:
+    """Yield a report section (nothing for an empty issue list)"""
+    if not issues:
+        return
+    yield title
+    yield "-" * 70
+    yield from chain.from_iterable(
+        _format_issue(number, issue) for number, issue in enumerate(issues, 1)
+    )
+
+
+class IssuesModel(QAbstractItemModel):
+    """
+    Item model over a list of ValidationIssues
+
+    Rows read straight from the issue list, so no per-issue item objects
+    are created. Each issue row has up to two children: an "Affected
+    Features:" group (whose children are the feature names) and the
+    suggestion. Issue indexes carry an internalId of 0, issue children
+    carry (issue row + 1) << 1, and feature rows carry that value | 1.
+
+    UserRole answers a (kind, payload) tag: ("issue", ValidationIssue),
+    ("feature", name) for navigable FEATURE_ names, ("name", name) for other
+    affected names, ("features", None) and ("suggestion", None).
+    """
+
+    COLUMNS = ["Issue", "Details"]
+
+    # Child row kinds under an issue
+    _FEATURES = 0
+    _SUGGESTION = 1
+
+    # Foreground colors
+    _COLOR_ERROR = QColor(0xdc, 0x35, 0x45)
+    _COLOR_WARN = QColor(0xff, 0xc1, 0x07)
+    _COLOR_INFO = QColor(0x17, 0xa2, 0xb8)
+    _COLOR_FEATURE = QColor(0x6c, 0x75, 0x7d)
+    _COLOR_SUGGEST = QColor(0x28, 0xa7, 0x45)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._issues: List[ValidationIssue] = []
+        self._child_kinds: List[tuple] = []
+
+    def set_issues(self, issues: List[ValidationIssue]) -> bool:
+        """
+        Replace the displayed issues
+
+        When every issue keeps the same children (features and suggestion)
+        as the one it replaces, only the issue rows change, so they are
+        patched in place with one dataChanged. Anything else is a
+        structural change and costs one modelReset.
+
+        Returns:
+            True if the model was reset
+        """
+        issues = list(issues)
+        if self._same_shape(issues):
+            self._issues = issues
+            if issues:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(issues) - 1, len(self.COLUMNS) - 1)
+                )
+            return False
+
+        self.beginResetModel()
+        self._issues = issues
+        self._child_kinds = [self._kinds_for(issue) for issue in issues]
+        self.endResetModel()
+        return True
+
+    def _same_shape(self, issues: List[ValidationIssue]) -> bool:
+        return len(issues) == len(self._issues) and all(
+            new.affected_features == old.affected_features
+            and new.suggestion == old.suggestion
+            for new, old in zip(issues, self._issues)
+        )
+
+    def issues(self) -> List[ValidationIssue]:
+        """Get the displayed issues"""
+        return self._issues
+
+    @classmethod
+    def _kinds_for(cls, issue: ValidationIssue) -> tuple:
+        kinds = ()
+        if issue.affected_features:
+            kinds += (cls._FEATURES,)
+        if issue.suggestion:
+            kinds += (cls._SUGGESTION,)
+        return kinds
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        parent_id = parent.internalId()
+        if parent_id == 0:
+            return self.createIndex(row, column, (parent.row() + 1) << 1)
+
+        if not parent_id & 1:
+            # Only the features group has children
+            return self.createIndex(row, column, parent_id | 1)
+
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+
+        internal_id = index.internalId()
+        if internal_id == 0:
+            return QModelIndex()
+
+        issue_row = (internal_id >> 1) - 1
+        if internal_id & 1:
+            # The features group is always the first child of its issue
+            return self.createIndex(0, 0, (issue_row + 1) << 1)
+
+        return self.createIndex(issue_row, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._issues)
+
+        if parent.column() != 0:
+            return 0
+
+        parent_id = parent.internalId()
+        if parent_id == 0:
+            return len(self._child_kinds[parent.row()])
+
+        if parent_id & 1:
+            return 0
+
+        issue_row = (parent_id >> 1) - 1
+        if self._child_kinds[issue_row][parent.row()] == self._FEATURES:
+            return len(self._issues[issue_row].affected_features)
+
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == MultipleRolesRole:
+            return self._multiple_roles(index)
+
+        column = index.column()
+        internal_id = index.internalId()
+
+        if internal_id == 0:
+            issue = self._issues[index.row()]
+            if role == _DISPLAY_ROLE:
+                if column == 0:
+                    if issue.auto_fixable:
+                        return _decorate("🔧 ", issue.message)
+                    return issue.message
+                return issue.rule_type.replace('_', ' ').title()
+            if column != 0:
+                return None
+            if role == _FOREGROUND_ROLE:
+                if issue.severity == _SEV_ERR:
+                    return self._COLOR_ERROR
+                if issue.severity == _SEV_WARN:
+                    return self._COLOR_WARN
+                return self._COLOR_INFO
+            if role == _USER_ROLE:
+                return ("issue", issue)
+            return None
+
+        if column != 0:
+            return None
+
+        issue = self._issues[(internal_id >> 1) - 1]
+
+        if internal_id & 1:
+            feature = issue.affected_features[index.row()]
+            if role == _DISPLAY_ROLE:
+                return feature
+            if role == _USER_ROLE:
+                # Only FEATURE_ names can be navigated to
+                if feature.startswith("FEATURE_"):
+                    return ("feature", feature)
+                return ("name", feature)
+            return None
+
+        if self._child_kinds[(internal_id >> 1) - 1][index.row()] == self._FEATURES:
+            if role == _DISPLAY_ROLE:
+                return "Affected Features:"
+            if role == _FOREGROUND_ROLE:
+                return self._COLOR_FEATURE
+            if role == _USER_ROLE:
+                return ("features", None)
+            return None
+
+        if role == _DISPLAY_ROLE:
+            return _decorate("💡 Suggestion: ", issue.suggestion)
+        if role == _FOREGROUND_ROLE:
+            return self._COLOR_SUGGEST
+        if role == _USER_ROLE:
+            return ("suggestion", None)
+        return None
+
+    def _multiple_roles(self, index: QModelIndex) -> dict:
+        return {role: self.data(index, role) for role in SpeedUpDelegate.PAINT_ROLES}
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.COLUMNS)):
+            return self.COLUMNS[section]
+        return None
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """
+    Item delegate that fetches all paint roles with one data() call
+
+    The default delegate asks the model for each role separately on every
+    paint. This one asks once for MultipleRolesRole and caches the result
+    per cell until the model reports a change, so repaints while scrolling
+    do not go back to the model at all.
+    """
+
+    PAINT_ROLES = frozenset((
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.FontRole,
+    ))
+
+    CACHE_SIZE = 2048
+
+    def __init__(self, view: QTreeView):
+        super().__init__(view)
+        self._cache: OrderedDict = OrderedDict()
+
+        model = view.model()
+        model.modelReset.connect(self.clear_cache)
+        model.layoutChanged.connect(self.clear_cache)
+        model.dataChanged.connect(self.clear_cache)
+        model.rowsInserted.connect(self.clear_cache)
+        model.rowsRemoved.connect(self.clear_cache)
+
+    def clear_cache(self, *args):
+        """Drop all cached role data"""
+        self._cache.clear()
+
+    def _roles(self, index: QModelIndex) -> dict:
+        key = (index.row(), index.column(), index.internalId())
+        roles = self._cache.get(key)
+        if roles is None:
+            roles = index.data(MultipleRolesRole) or {}
+            self._cache[key] = roles
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return roles
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        roles = self._roles(index)
+        option.index = index
+
+        font = roles.get(_FONT_ROLE)
+        if font is not None:
+            option.font = font
+
+        foreground = roles.get(_FOREGROUND_ROLE)
+        if foreground is not None:
+            option.palette.setBrush(QPalette.ColorRole.Text, QBrush(foreground))
+
+        text = roles.get(_DISPLAY_ROLE)
+        if text is not None:
+            option.text = text
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
 
 class ValidationPanel(QWidget):
     """
@@ -37,10 +359,59 @@ class ValidationPanel(QWidget):
     fix_requested = pyqtSignal(list)  # List of features to fix
     feature_selected = pyqtSignal(str)  # Feature name to navigate to
 
+    # Status label stylesheets
+    _QSS_NEUTRAL = """
+        QLabel {
+            font-weight: bold;
+            font-size: 14px;
+            padding: 8px;
+            border-radius: 4px;
+            background-color: #f0f0f0;
+        }
+    """
+    _QSS_PASS = """
+        QLabel {
+            font-weight: bold;
+            font-size: 14px;
+            padding: 8px;
+            border-radius: 4px;
+            background-color: #d4edda;
+            color: #155724;
+        }
+    """
+    _QSS_FAIL = """
+        QLabel {
+            font-weight: bold;
+            font-size: 14px;
+            padding: 8px;
+            border-radius: 4px;
+            background-color: #f8d7da;
+            color: #721c24;
+        }
+    """
+
     def __init__(self, parent=None):
         """Initialize validation panel"""
         super().__init__(parent)
         self.validation_result: Optional[ValidationResult] = None
+        self._report_cache: Optional[tuple] = None  # (id(result), report)
+        self._last_signature: Optional[tuple] = None
+        self._auto_fixable: List[ValidationIssue] = []
+        self._clipboard = None  # QApplication clipboard, fetched on first copy
+        self._pending_expand = set()  # Trees waiting for the deferred expandAll
+
+        # Context menu builders by item tag kind
+        self._menu_builders = {
+            "issue": self._issue_menu_actions,
+            "feature": self._feature_menu_actions,
+        }
+
+        # Debounce validation requests so rapid clicks start one validator run
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(200)
+        self._validate_timer.timeout.connect(self.validation_requested)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -51,22 +422,14 @@ class ValidationPanel(QWidget):
         header_layout = QHBoxLayout()
 
         self.status_label = QLabel("No validation run")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-            }
-        """)
+        self._set_status_style(self._QSS_NEUTRAL)
         header_layout.addWidget(self.status_label)
 
         header_layout.addStretch()
 
         # Validate button
         self.validate_btn = QPushButton("Validate Configuration")
-        self.validate_btn.clicked.connect(self.validation_requested.emit)
+        self.validate_btn.clicked.connect(self._request_validate)
         self.validate_btn.setStyleSheet("""
             QPushButton {
                 padding: 8px 16px;
@@ -123,18 +486,30 @@ class ValidationPanel(QWidget):
 
         layout.addLayout(footer_layout)
 
-    def _create_issues_tree(self) -> QTreeWidget:
-        """Create tree widget for displaying issues"""
-        tree = QTreeWidget()
-        tree.setHeaderLabels(["Issue", "Details"])
+    def _create_issues_tree(self) -> QTreeView:
+        """Create tree view (backed by an IssuesModel) for displaying issues"""
+        tree = QTreeView()
+        tree.setModel(IssuesModel(tree))
+        tree.setItemDelegate(SpeedUpDelegate(tree))
         tree.setColumnWidth(0, 400)
         tree.setAlternatingRowColors(True)
         tree.setRootIsDecorated(True)
-        tree.itemClicked.connect(self._on_item_clicked)
+        tree.setUniformRowHeights(True)
+        tree.clicked.connect(self._on_item_clicked)
         tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         tree.customContextMenuRequested.connect(self._show_context_menu)
         return tree
 
+    def _set_status_style(self, stylesheet: str):
+        """Apply a status stylesheet, skipping the QSS re-parse if unchanged"""
+        if self.status_label.styleSheet() != stylesheet:
+            self.status_label.setStyleSheet(stylesheet)
+
+    def _request_validate(self):
+        """Request validation; the button stays disabled until a result arrives"""
+        self.validate_btn.setEnabled(False)
+        self._validate_timer.start()
+
     def set_validation_result(self, result: ValidationResult):
         """
         Update panel with new validation results
@@ -142,50 +517,37 @@ class ValidationPanel(QWidget):
         Args:
             result: ValidationResult from validator
         """
+        self.validate_btn.setEnabled(True)
         self.validation_result = result
+        self._report_cache = None
+
+        # Re-validation often hands back the very same issues; nothing to redraw
+        signature = (
+            result.passed,
+            tuple(map(id, result.errors)),
+            tuple(map(id, result.warnings)),
+            tuple(map(id, result.info)),
+        )
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+
+        self._auto_fixable = result.auto_fixable_issues
 
-        # Clear existing items
-        self.errors_tree.clear()
-        self.warnings_tree.clear()
-        self.info_tree.clear()
+        # Each model patches its rows in place or swaps its list with one reset
+        for tree, issues in ((self.errors_tree, result.errors),
+                             (self.warnings_tree, result.warnings),
+                             (self.info_tree, result.info)):
+            if tree.model().set_issues(issues):
+                self._schedule_expand(tree)
 
         # Update status label
         if result.passed:
             self.status_label.setText(f"✅ Validation Passed ({result.total_issues} suggestions)")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    font-size: 14px;
-                    padding: 8px;
-                    border-radius: 4px;
-                    background-color: #d4edda;
-                    color: #155724;
-                }
-            """)
+            self._set_status_style(self._QSS_PASS)
         else:
             self.status_label.setText(f"❌ Validation Failed ({len(result.errors)} errors)")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    font-size: 14px;
-                    padding: 8px;
-                    border-radius: 4px;
-                    background-color: #f8d7da;
-                    color: #721c24;
-                }
-            """)
-
-        # Populate errors
-        for issue in result.errors:
-            self._add_issue_to_tree(self.errors_tree, issue)
-
-        # Populate warnings
-        for issue in result.warnings:
-            self._add_issue_to_tree(self.warnings_tree, issue)
-
-        # Populate info
-        for issue in result.info:
-            self._add_issue_to_tree(self.info_tree, issue)
+            self._set_status_style(self._QSS_FAIL)
 
         # Update tab labels with counts
         self.tabs.setTabText(0, f"Errors ({len(result.errors)})")
@@ -193,118 +555,97 @@ class ValidationPanel(QWidget):
         self.tabs.setTabText(2, f"Info ({len(result.info)})")
 
         # Enable/disable auto-fix button
-        has_auto_fixable = any(
-            issue.auto_fixable
-            for issue in result.errors + result.warnings + result.info
-        )
-        self.auto_fix_btn.setEnabled(has_auto_fixable)
+        self.auto_fix_btn.setEnabled(bool(self._auto_fixable))
 
         # Enable export button
         self.export_btn.setEnabled(True)
 
-        # Expand all items
-        self.errors_tree.expandAll()
-        self.warnings_tree.expandAll()
-        self.info_tree.expandAll()
-
         # Switch to errors tab if there are errors
         if result.errors:
             self.tabs.setCurrentIndex(0)
 
-    def _add_issue_to_tree(self, tree: QTreeWidget, issue: ValidationIssue):
-        """Add validation issue to tree widget"""
-        # Create top-level item
-        item = QTreeWidgetItem(tree)
-        item.setText(0, issue.message)
-        item.setText(1, issue.rule_type.replace('_', ' ').title())
-        item.setData(0, Qt.ItemDataRole.UserRole, issue)
-
-        # Set color based on severity
-        if issue.severity == ValidationSeverity.ERROR:
-            item.setForeground(0, QColor("#dc3545"))
-        elif issue.severity == ValidationSeverity.WARNING:
-            item.setForeground(0, QColor("#ffc107"))
-        else:
-            item.setForeground(0, QColor("#17a2b8"))
-
-        # Add auto-fix indicator
-        if issue.auto_fixable:
-            item.setText(0, f"🔧 {issue.message}")
-
-        # Add affected features as children
-        if issue.affected_features:
-            features_item = QTreeWidgetItem(item)
-            features_item.setText(0, "Affected Features:")
-            features_item.setForeground(0, QColor("#6c757d"))
+    def _schedule_expand(self, tree: QTreeView):
+        """
+        Expand a reset tree once control returns to the event loop
 
-            for feature in issue.affected_features:
-                feature_item = QTreeWidgetItem(features_item)
-                feature_item.setText(0, feature)
-                feature_item.setData(0, Qt.ItemDataRole.UserRole, feature)
+        Trees reset several times before then (e.g. back-to-back results)
+        still get a single expandAll layout pass each.
+        """
+        if not self._pending_expand:
+            QTimer.singleShot(0, self._expand_pending_trees)
+        self._pending_expand.add(tree)
+
+    def _expand_pending_trees(self):
+        """Expand the trees reset since the last pass"""
+        trees, self._pending_expand = self._pending_expand, set()
+        for tree in trees:
+            tree.expandAll()
+
+    @staticmethod
+    def _item_tag(index: QModelIndex) -> tuple:
+        """(kind, payload) tag of the row under index"""
+        return index.siblingAtColumn(0).data(_USER_ROLE) or (None, None)
+
+    def _on_item_clicked(self, index: QModelIndex):
+        """Handle item click - navigate to feature if applicable"""
+        kind, payload = self._item_tag(index)
+        if kind == "feature":
+            self.feature_selected.emit(payload)
+
+    def _issue_menu_actions(self, menu: QMenu, issue: ValidationIssue):
+        """Context menu actions for an issue row"""
+        # Copy message action
+        copy_action = QAction("Copy Message", self)
+        copy_action.triggered.connect(
+            lambda: self._copy_to_clipboard(issue.message)
+        )
+        menu.addAction(copy_action)
 
-        # Add suggestion as child
-        if issue.suggestion:
-            suggestion_item = QTreeWidgetItem(item)
-            suggestion_item.setText(0, f"💡 Suggestion: {issue.suggestion}")
-            suggestion_item.setForeground(0, QColor("#28a745"))
+        # Auto-fix action if applicable
+        if issue.auto_fixable:
+            fix_action = QAction("Apply Auto-Fix", self)
+            fix_action.triggered.connect(
+                lambda: self._apply_single_fix(issue)
+            )
+            menu.addAction(fix_action)
+
+    def _feature_menu_actions(self, menu: QMenu, feature: str):
+        """Context menu actions for a FEATURE_ row"""
+        # Navigate to feature
+        nav_action = QAction(f"Go to {feature}", self)
+        nav_action.triggered.connect(
+            lambda: self.feature_selected.emit(feature)
+        )
+        menu.addAction(nav_action)
 
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
-        """Handle item click - navigate to feature if applicable"""
-        # Check if this is a feature item
-        feature_data = item.data(0, Qt.ItemDataRole.UserRole)
-        if isinstance(feature_data, str) and feature_data.startswith("FEATURE_"):
-            self.feature_selected.emit(feature_data)
+        # Copy feature name
+        copy_action = QAction("Copy Feature Name", self)
+        copy_action.triggered.connect(
+            lambda: self._copy_to_clipboard(feature)
+        )
+        menu.addAction(copy_action)
 
     def _show_context_menu(self, position):
         """Show context menu for tree items"""
         tree = self.sender()
-        item = tree.itemAt(position)
-        if not item:
+        index = tree.indexAt(position)
+        if not index.isValid():
             return
 
-        menu = QMenu(self)
-
-        # Get issue data
-        issue_data = item.data(0, Qt.ItemDataRole.UserRole)
-
-        if isinstance(issue_data, ValidationIssue):
-            # Copy message action
-            copy_action = QAction("Copy Message", self)
-            copy_action.triggered.connect(
-                lambda: self._copy_to_clipboard(issue_data.message)
-            )
-            menu.addAction(copy_action)
-
-            # Auto-fix action if applicable
-            if issue_data.auto_fixable:
-                fix_action = QAction("Apply Auto-Fix", self)
-                fix_action.triggered.connect(
-                    lambda: self._apply_single_fix(issue_data)
-                )
-                menu.addAction(fix_action)
-
-        elif isinstance(issue_data, str) and issue_data.startswith("FEATURE_"):
-            # Navigate to feature
-            nav_action = QAction(f"Go to {issue_data}", self)
-            nav_action.triggered.connect(
-                lambda: self.feature_selected.emit(issue_data)
-            )
-            menu.addAction(nav_action)
-
-            # Copy feature name
-            copy_action = QAction("Copy Feature Name", self)
-            copy_action.triggered.connect(
-                lambda: self._copy_to_clipboard(issue_data)
-            )
-            menu.addAction(copy_action)
+        kind, payload = self._item_tag(index)
+        add_actions = self._menu_builders.get(kind)
+        if add_actions is None:
+            return
 
+        menu = QMenu(self)
+        add_actions(menu, payload)
         menu.exec(tree.viewport().mapToGlobal(position))
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard"""
-        from PyQt6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        if self._clipboard is None:
+            self._clipboard = QApplication.clipboard()
+        self._clipboard.setText(text)
 
     def _apply_single_fix(self, issue: ValidationIssue):
         """Apply auto-fix for single issue"""
@@ -326,14 +667,8 @@ class ValidationPanel(QWidget):
         if not self.validation_result:
             return
 
-        # Collect all auto-fixable issues
-        fixable_issues = [
-            issue for issue in
-            self.validation_result.errors +
-            self.validation_result.warnings +
-            self.validation_result.info
-            if issue.auto_fixable
-        ]
+        # Auto-fixable issues were collected when the result was set
+        fixable_issues = self._auto_fixable
 
         if not fixable_issues:
             return
@@ -352,7 +687,7 @@ class ValidationPanel(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.fix_requested.emit(fixable_issues)
+            self.fix_requested.emit(list(fixable_issues))
 
     def _on_export_clicked(self):
         """Export validation report to file"""
@@ -371,10 +706,12 @@ class ValidationPanel(QWidget):
             return
 
         try:
-            report = self._generate_report()
-
-            with open(filename, 'w') as f:
-                f.write(report)
+            # Stream the report line by line instead of building it in memory
+            lines = self._iter_report_lines()
+            with open(filename, 'w', buffering=64 * 1024,
+                      encoding='utf-8', newline='\n') as f:
+                f.write(next(lines, ""))
+                f.writelines("\n" + line for line in lines)
 
             QMessageBox.information(
                 self,
@@ -389,87 +726,55 @@ class ValidationPanel(QWidget):
                 f"Failed to export validation report:\n{str(e)}"
             )
 
+    def _iter_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the text report of validation results"""
+        result = self.validation_result
+        rule = "=" * 70
+        yield from (
+            rule,
+            "K3NG Configuration Tool - Validation Report",
+            rule,
+            "",
+            "Summary",
+            "-" * 70,
+            f"Status: {'PASSED' if result.passed else 'FAILED'}",
+            f"Errors: {len(result.errors)}",
+            f"Warnings: {len(result.warnings)}",
+            f"Info: {len(result.info)}",
+            "",
+        )
+        yield from _format_section("Errors", result.errors)
+        yield from _format_section("Warnings", result.warnings)
+        yield from _format_section("Information", result.info)
+        yield from (rule, "End of Report", rule)
+
     def _generate_report(self) -> str:
         """Generate text report of validation results"""
         if not self.validation_result:
             return "No validation results available"
 
-        lines = []
-        lines.append("=" * 70)
-        lines.append("K3NG Configuration Tool - Validation Report")
-        lines.append("=" * 70)
-        lines.append("")
-
-        # Summary
-        lines.append("Summary")
-        lines.append("-" * 70)
-        status = "PASSED" if self.validation_result.passed else "FAILED"
-        lines.append(f"Status: {status}")
-        lines.append(f"Errors: {len(self.validation_result.errors)}")
-        lines.append(f"Warnings: {len(self.validation_result.warnings)}")
-        lines.append(f"Info: {len(self.validation_result.info)}")
-        lines.append("")
-
-        # Errors
-        if self.validation_result.errors:
-            lines.append("Errors")
-            lines.append("-" * 70)
-            for i, issue in enumerate(self.validation_result.errors, 1):
-                lines.append(f"{i}. {issue.message}")
-                if issue.affected_features:
-                    lines.append(f"   Affects: {', '.join(issue.affected_features)}")
-                if issue.suggestion:
-                    lines.append(f"   Suggestion: {issue.suggestion}")
-                lines.append("")
-
-        # Warnings
-        if self.validation_result.warnings:
-            lines.append("Warnings")
-            lines.append("-" * 70)
-            for i, issue in enumerate(self.validation_result.warnings, 1):
-                lines.append(f"{i}. {issue.message}")
-                if issue.affected_features:
-                    lines.append(f"   Affects: {', '.join(issue.affected_features)}")
-                if issue.suggestion:
-                    lines.append(f"   Suggestion: {issue.suggestion}")
-                lines.append("")
-
-        # Info
-        if self.validation_result.info:
-            lines.append("Information")
-            lines.append("-" * 70)
-            for i, issue in enumerate(self.validation_result.info, 1):
-                lines.append(f"{i}. {issue.message}")
-                if issue.affected_features:
-                    lines.append(f"   Affects: {', '.join(issue.affected_features)}")
-                if issue.suggestion:
-                    lines.append(f"   Suggestion: {issue.suggestion}")
-                lines.append("")
-
-        lines.append("=" * 70)
-        lines.append("End of Report")
-        lines.append("=" * 70)
-
-        return "\n".join(lines)
+        if self._report_cache and self._report_cache[0] == id(self.validation_result):
+            return self._report_cache[1]
+
+        report = "\n".join(self._iter_report_lines())
+        self._report_cache = (id(self.validation_result), report)
+        return report
 
     def clear(self):
         """Clear validation panel"""
         self.validation_result = None
-        self.errors_tree.clear()
-        self.warnings_tree.clear()
-        self.info_tree.clear()
+        self._report_cache = None
+        self._last_signature = None
+        self._auto_fixable = []
+        self.errors_tree.model().set_issues([])
+        self.warnings_tree.model().set_issues([])
+        self.info_tree.model().set_issues([])
         self.status_label.setText("No validation run")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-            }
-        """)
+        self._set_status_style(self._QSS_NEUTRAL)
         self.tabs.setTabText(0, "Errors (0)")
         self.tabs.setTabText(1, "Warnings (0)")
         self.tabs.setTabText(2, "Info (0)")
         self.auto_fix_btn.setEnabled(False)
         self.export_btn.setEnabled(False)
+        self._validate_timer.stop()
+        self.validate_btn.setEnabled(True)
@@ -7,10 +7,13 @@ GUI Entry Point
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 from PyQt6.QtWidgets import QApplication
+
+# Add parent directory to path for imports (once)
+_APP_DIR = str(Path(__file__).parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
 from gui.main_window import MainWindow
 
 
@@ -30,7 +33,8 @@ def main():
     # If a project directory was passed as argument, load it
     if len(sys.argv) > 1:
         project_dir = Path(sys.argv[1])
-        if project_dir.exists() and project_dir.is_dir():
+        # is_dir() is a single stat and is False for missing paths
+        if project_dir.is_dir():
             window.load_project(project_dir)
 
     sys.exit(app.exec())
@@ -3,11 +3,32 @@ K3NG Configuration Tool - Command Interface
 Provides high-level interface for K3NG backslash commands
 """
 
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, Callable
 from PyQt6.QtCore import QObject, pyqtSignal
 from .serial_manager import SerialManager
 
 
+class _PinCommandTable(dict):
+    """Pin number -> I/O command string, formatted once per pin"""
+
+    def __init__(self, prefix: str):
+        super().__init__()
+        self._prefix = prefix
+
+    def __missing__(self, pin: int) -> str:
+        command = self[pin] = f'\\?{self._prefix}{pin:02d}'
+        return command
+
+
+@lru_cache(maxsize=1024)
+def _analog_write_command(pin: int, value: int) -> str:
+    """PWM write command string, memoized per (pin, value)"""
+    return f'\\?AW{pin:02d}{value:03d}'
+
+
 class K3NGCommandInterface(QObject):
     """High-level interface for K3NG controller commands"""
 
@@ -15,6 +36,16 @@ class K3NGCommandInterface(QObject):
     response_received = pyqtSignal(str, str)  # command, response
     command_sent = pyqtSignal(str)  # command
 
+    # Per-pin I/O command strings, shared by all instances
+    _DO = _PinCommandTable('DO')
+    _DH = _PinCommandTable('DH')
+    _DL = _PinCommandTable('DL')
+    _DR = _PinCommandTable('DR')
+    _AR = _PinCommandTable('AR')
+
+    # Responses kept for get_last_responses (oldest are dropped)
+    RESPONSE_BUFFER_SIZE = 1024
+
     def __init__(self, serial_manager: SerialManager):
         super().__init__()
         self.serial = serial_manager
@@ -24,13 +55,14 @@ class K3NGCommandInterface(QObject):
 
         # Response tracking
         self.last_command = None
-        self.response_buffer = []
+        self.response_buffer = deque(maxlen=self.RESPONSE_BUFFER_SIZE)
 
-    def _on_data_received(self, data: str):
-        """Handle data received from serial port"""
-        self.response_buffer.append(data)
+    def _on_data_received(self, lines: list):
+        """Handle lines received from serial port"""
+        self.response_buffer.extend(lines)
         if self.last_command:
-            self.response_received.emit(self.last_command, data)
+            for line in lines:
+                self.response_received.emit(self.last_command, line)
 
     def send_command(self, command: str):
         """Send a command and track it"""
@@ -65,27 +97,27 @@ class K3NGCommandInterface(QObject):
 
     def digital_output_init(self, pin: int):
         """Initialize pin as digital output"""
-        self.send_command(f'\\?DO{pin:02d}')
+        self.send_command(self._DO[pin])
 
     def digital_set_high(self, pin: int):
         """Set digital pin HIGH"""
-        self.send_command(f'\\?DH{pin:02d}')
+        self.send_command(self._DH[pin])
 
     def digital_set_low(self, pin: int):
         """Set digital pin LOW"""
-        self.send_command(f'\\?DL{pin:02d}')
+        self.send_command(self._DL[pin])
 
     def digital_read(self, pin: int):
         """Read digital pin"""
-        self.send_command(f'\\?DR{pin:02d}')
+        self.send_command(self._DR[pin])
 
     def analog_read(self, pin: int):
         """Read analog pin (0-1023)"""
-        self.send_command(f'\\?AR{pin:02d}')
+        self.send_command(self._AR[pin])
 
     def analog_write_pwm(self, pin: int, value: int):
         """Write PWM value to pin (0-255)"""
-        self.send_command(f'\\?AW{pin:02d}{value:03d}')
+        self.send_command(_analog_write_command(pin, value))
 
     # ===== Calibration Commands =====
 
@@ -233,4 +265,7 @@ class K3NGCommandInterface(QObject):
 
     def get_last_responses(self, count: int = 10) -> list:
         """Get last N responses"""
-        return self.response_buffer[-count:] if self.response_buffer else []
+        # Walk back from the newest entry so only `count` items are visited
+        responses = list(islice(reversed(self.response_buffer), max(0, count)))
+        responses.reverse()
+        return responses
@@ -7,10 +7,11 @@ import serial
 import serial.tools.list_ports
 from typing import List, Optional, Callable
 from dataclasses import dataclass
+from collections import deque
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+import selectors
+import socket
 import threading
-import queue
-import time
 
 
 @dataclass
@@ -30,9 +31,12 @@ class SerialManager(QObject):
     # Signals
     connected = pyqtSignal(str)  # port
     disconnected = pyqtSignal()
-    data_received = pyqtSignal(str)  # data
+    data_received = pyqtSignal(list)  # complete lines from one read burst
     error_occurred = pyqtSignal(str)  # error message
 
+    # Read timeout while the reader thread waits for data (seconds)
+    READ_POLL_TIMEOUT = 0.1
+
     def __init__(self):
         super().__init__()
 
@@ -40,12 +44,16 @@ class SerialManager(QObject):
         self.port_name: Optional[str] = None
         self.is_connected = False
 
-        # Read thread
+        # Read thread (also performs all port writes)
         self.read_thread: Optional[threading.Thread] = None
         self.stop_reading = threading.Event()
 
-        # Write queue for thread-safe writing
-        self.write_queue = queue.Queue()
+        # Single-producer (caller) / single-consumer (read thread) write
+        # queue; deque append/popleft are atomic, so no lock is taken
+        self.write_queue: deque = deque()
+
+        # Socket the read thread's selector watches so queued writes wake it
+        self._wake_socket: Optional[socket.socket] = None
 
         # Default settings for K3NG controllers
         self.baud_rate = 9600
@@ -79,11 +87,14 @@ class SerialManager(QObject):
                 write_timeout=self.write_timeout
             )
 
+            self._enable_low_latency()
+
             self.port_name = port
             self.baud_rate = baud_rate
             self.is_connected = True
 
-            # Start read thread
+            # Start read thread (commands queued for a previous port are dropped)
+            self.write_queue.clear()
             self.stop_reading.clear()
             self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
             self.read_thread.start()
@@ -100,14 +111,33 @@ class SerialManager(QObject):
             self.error_occurred.emit(f"Unexpected error: {str(e)}")
             return False
 
+    def _enable_low_latency(self):
+        """
+        Ask the tty driver for low-latency mode (Linux only, best effort)
+
+        USB-serial adapters such as FTDI otherwise hold received data for
+        their latency timer (16 ms by default) before passing it on, which
+        dominates every command/response round trip. Ports that do not
+        support the setting (non-Linux, CDC-ACM, ptys) are left unchanged.
+        """
+        set_low_latency_mode = getattr(self.serial_port, 'set_low_latency_mode', None)
+        if set_low_latency_mode is None:
+            return
+
+        try:
+            set_low_latency_mode(True)
+        except (ValueError, OSError):
+            pass
+
     def disconnect(self):
         """Disconnect from serial port"""
         if not self.is_connected:
             return
 
-        # Stop read thread
+        # Stop read thread (unless the read thread itself is disconnecting)
         self.stop_reading.set()
-        if self.read_thread and self.read_thread.is_alive():
+        if (self.read_thread and self.read_thread.is_alive()
+                and self.read_thread is not threading.current_thread()):
             self.read_thread.join(timeout=2.0)
 
         # Close serial port
@@ -125,7 +155,13 @@ class SerialManager(QObject):
         self.disconnected.emit()
 
     def send_command(self, command: str):
-        """Send a command to the controller"""
+        """
+        Queue a command for the controller
+
+        The read thread performs the write, so the caller (normally the GUI
+        thread) never blocks on a back-pressured USB endpoint. Write errors
+        are reported through error_occurred from that thread.
+        """
         if not self.is_connected or not self.serial_port:
             self.error_occurred.emit("Not connected to serial port")
             return
@@ -135,38 +171,91 @@ class SerialManager(QObject):
             if not command.endswith('\n'):
                 command += '\n'
 
-            # Write to serial port
-            self.serial_port.write(command.encode('utf-8'))
-            self.serial_port.flush()
+            self.write_queue.append(command.encode('utf-8'))
+            self._wake_reader()
 
-        except serial.SerialException as e:
-            self.error_occurred.emit(f"Failed to send command: {str(e)}")
-            self.disconnect()
         except Exception as e:
             self.error_occurred.emit(f"Unexpected error sending command: {str(e)}")
 
+    def _wake_reader(self):
+        """Interrupt the read thread's wait so it writes queued commands now"""
+        wake_socket = self._wake_socket
+        if wake_socket is not None:
+            try:
+                wake_socket.send(b'\0')
+            except OSError:
+                # Closed with the read loop, or already full of pending wakeups
+                pass
+            return
+
+        # No selector: break the blocking read(1) instead
+        port = self.serial_port
+        cancel_read = getattr(port, 'cancel_read', None)
+        if cancel_read is not None:
+            cancel_read()
+
+    def _drain_writes(self, port):
+        """Write every queued command, then flush once"""
+        written = False
+        while True:
+            try:
+                packet = self.write_queue.popleft()
+            except IndexError:
+                break
+            port.write(packet)
+            written = True
+
+        if written:
+            port.flush()
+
     def _read_loop(self):
         """Read loop running in separate thread"""
-        buffer = ""
+        buffer = bytearray()
+
+        # Wait in the kernel for each burst; the short timeout only bounds
+        # how long stop_reading takes to be noticed
+        if self.serial_port:
+            self.serial_port.timeout = self.READ_POLL_TIMEOUT
+        selector, wake_send = self._open_selector(self.serial_port)
 
         while not self.stop_reading.is_set() and self.is_connected:
             try:
-                if self.serial_port and self.serial_port.in_waiting > 0:
-                    # Read available data
-                    data = self.serial_port.read(self.serial_port.in_waiting)
-                    decoded = data.decode('utf-8', errors='replace')
-                    buffer += decoded
-
-                    # Process complete lines
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.rstrip('\r')
-                        if line:  # Skip empty lines
-                            self.data_received.emit(line)
-
-                else:
-                    # Small sleep to avoid busy waiting
-                    time.sleep(0.01)
+                port = self.serial_port
+                if not port:
+                    break
+
+                try:
+                    self._drain_writes(port)
+                except serial.SerialException as e:
+                    self.error_occurred.emit(f"Failed to send command: {str(e)}")
+                    self.disconnect()
+                    break
+
+                data = self._read_burst(port, selector)
+                if not data:
+                    continue
+
+                buffer.extend(data)
+
+                # Process complete lines, decoding each one only once it is whole
+                lines = []
+                while True:
+                    end = buffer.find(b'\n')
+                    if end < 0:
+                        break
+                    line = bytes(buffer[:end]).rstrip(b'\r')
+                    del buffer[:end + 1]
+                    if line:  # Skip empty lines
+                        # K3NG output is plain ASCII; only fall back to the
+                        # replacing UTF-8 decoder for anything else
+                        if line.isascii():
+                            lines.append(line.decode('ascii'))
+                        else:
+                            lines.append(line.decode('utf-8', errors='replace'))
+
+                # One cross-thread signal per burst rather than per line
+                if lines:
+                    self.data_received.emit(lines)
 
             except serial.SerialException as e:
                 self.error_occurred.emit(f"Serial read error: {str(e)}")
@@ -174,8 +263,83 @@ class SerialManager(QObject):
                 break
             except Exception as e:
                 self.error_occurred.emit(f"Unexpected read error: {str(e)}")
+                self.disconnect()
                 break
 
+        if selector is not None:
+            self._close_selector(selector, wake_send)
+
+    def _open_selector(self, port) -> tuple:
+        """
+        Selector watching the port for input, or (None, None) if it has no
+        pollable fd
+
+        The selector also watches a socket pair whose other end
+        _wake_reader writes to, so queued commands interrupt the wait.
+
+        Returns:
+            (selector, wake_send) - wake_send belongs to this read loop and
+            is also published as _wake_socket for _wake_reader
+        """
+        if port is None:
+            return None, None
+
+        selector = selectors.DefaultSelector()
+        try:
+            # POSIX ports expose their tty fd; Windows ports have no fileno()
+            selector.register(port.fileno(), selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError):
+            selector.close()
+            return None, None
+
+        wake_recv, wake_send = socket.socketpair()
+        wake_recv.setblocking(False)
+        wake_send.setblocking(False)
+        selector.register(wake_recv, selectors.EVENT_READ, wake_recv)
+        self._wake_socket = wake_send
+        return selector, wake_send
+
+    def _close_selector(self, selector: selectors.BaseSelector,
+                        wake_send: socket.socket):
+        """Close the selector and this read loop's wakeup socket pair"""
+        # A read thread that outlived a timed-out disconnect must not
+        # unpublish (or close) the wakeup socket of a newer connection
+        if self._wake_socket is wake_send:
+            self._wake_socket = None
+        for key in list(selector.get_map().values()):
+            if key.data is not None:
+                key.data.close()
+        selector.close()
+        wake_send.close()
+
+    def _read_burst(self, port, selector: Optional[selectors.BaseSelector]) -> bytes:
+        """Wait up to READ_POLL_TIMEOUT for input and return all that is available"""
+        if selector is not None:
+            data = b''
+            for key, _ in selector.select(self.READ_POLL_TIMEOUT):
+                if key.data is not None:
+                    # Wakeup for queued writes; discard the wake bytes
+                    try:
+                        wake_bytes = key.data.recv(4096)
+                    except BlockingIOError:
+                        continue
+                    if not wake_bytes:
+                        # Other end closed: stop watching it so select()
+                        # does not keep reporting it readable at EOF
+                        selector.unregister(key.fileobj)
+                        key.data.close()
+                else:
+                    data = port.read(port.in_waiting or 1)
+            return data
+
+        # No selectable fd: block in the driver for the first byte, then
+        # drain the rest of the burst in one read
+        head = port.read(1)
+        if not head:
+            return head
+        waiting = port.in_waiting
+        return head + port.read(waiting) if waiting else head
+
     def get_connection_info(self) -> dict:
         """Get current connection information"""
         if not self.is_connected:
@@ -44,6 +44,8 @@ class SettingCategory:
     name: str
     settings: List[str] = field(default_factory=list)
     description: Optional[str] = None
+    # Definitions of the settings above, in the same order, resolved at parse time
+    setting_defs: List[SettingDefinition] = field(default_factory=list, repr=False)
 
 
 @dataclass
@@ -357,10 +359,14 @@ class SettingsParser:
                 categories_dict[category] = []
             categories_dict[category].append(name)
 
-        categories = [
-            SettingCategory(name=cat_name, settings=sorted(settings))
-            for cat_name, settings in sorted(categories_dict.items())
-        ]
+        categories = []
+        for cat_name, settings in sorted(categories_dict.items()):
+            names = sorted(settings)
+            categories.append(SettingCategory(
+                name=cat_name,
+                settings=names,
+                setting_defs=[self.settings[name] for name in names],
+            ))
 
         return categories
 
@@ -9,6 +9,7 @@ from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
+from itertools import chain
 import yaml
 
 
@@ -48,6 +49,11 @@ class ValidationResult:
     def total_issues(self) -> int:
         return len(self.errors) + len(self.warnings) + len(self.info)
 
+    @property
+    def auto_fixable_issues(self) -> List[ValidationIssue]:
+        return [issue for issue in chain(self.errors, self.warnings, self.info)
+                if issue.auto_fixable]
+
     def __repr__(self) -> str:
         status = "✅ PASSED" if self.passed else "❌ FAILED"
         return f"ValidationResult({status}, {len(self.errors)} errors, {len(self.warnings)} warnings)"